@@ -1,171 +1,315 @@
-from typing import List, Tuple
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterator, List, Sequence, Tuple
 from .models import IndustryCategory, AnalysisMethod, IndustryCategoryInfo
-from .constants import INDUSTRY_KEYWORDS, INDUSTRY_METHODS, INDUSTRY_NAMES
+from .constants import (
+    INDUSTRY_METHODS,
+    INDUSTRY_NAMES_ARR,
+    INDUSTRY_CATEGORIES,
+    CAT_IDS,
+    N_CATEGORIES,
+    KEYWORD_TO_CATEGORIES,
+    METHOD_DESCRIPTIONS,
+    METHOD_VALUE,
+    METHOD_BIT,
+    FIRST_METHOD,
+    SECOND_METHOD,
+)
+from .config import settings
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치 시 정규식 매처 사용
+    ahocorasick = None
 
-class IndustryClassifier:
-    """업종 분류 로직"""
+
+# 소문자 키워드 → ((업종 ID, 원본 키워드), ...)
+_KEYWORD_OWNERS = {
+    keyword_lower: tuple((CAT_IDS[category], keyword) for category, keyword in owners)
+    for keyword_lower, owners in KEYWORD_TO_CATEGORIES.items()
+}
+
+if ahocorasick is not None and settings.keyword_matcher == "aho_corasick":
+    # 전체 업종 키워드를 하나의 Aho-Corasick 오토마톤으로 구성 (import 시 1회)
+    _AC = ahocorasick.Automaton()
+    for _keyword_lower, _owners in _KEYWORD_OWNERS.items():
+        _AC.add_word(_keyword_lower, _owners)
+    _AC.make_automaton()
     
-    @staticmethod
-    def classify_business(business_description: str) -> List[IndustryCategoryInfo]:
-        """
-        사업 내용을 분석하여 적합한 업종 카테고리를 분류
-        
-        Args:
-            business_description: 사업 내용 설명
-            
-        Returns:
-            List[IndustryCategoryInfo]: 매칭된 업종 카테고리 (최대 2개, 신뢰도 순)
-        """
-        description_lower = business_description.lower()
-        scores = {}
-        
-        # 각 업종별 키워드 매칭 점수 계산
-        for category, keywords in INDUSTRY_KEYWORDS.items():
-            score = 0
-            matched_keywords = []
-            
-            for keyword in keywords:
-                if keyword.lower() in description_lower:
-                    score += 1
-                    matched_keywords.append(keyword)
-            
-            if score > 0:
-                # 신뢰도 계산 (매칭된 키워드 수 기반)
-                confidence = min(score * 15, 95)  # 최대 95%
-                scores[category] = {
-                    'confidence': confidence,
-                    'matched_keywords': matched_keywords
-                }
-        
-        # 매칭된 카테고리가 없으면 범용 비즈니스로 분류
-        if not scores:
-            scores[IndustryCategory.GENERAL_BUSINESS] = {
-                'confidence': 50,
-                'matched_keywords': []
-            }
-        
-        # 신뢰도 순으로 정렬하여 상위 2개 선택
-        sorted_categories = sorted(
-            scores.items(), 
-            key=lambda x: x[1]['confidence'], 
-            reverse=True
-        )[:2]
-        
-        result = []
-        for category, data in sorted_categories:
-            result.append(IndustryCategoryInfo(
-                category_id=category,
-                category_name=INDUSTRY_NAMES[category],
-                confidence_score=data['confidence']
-            ))
-        
-        return result
-    
-    @staticmethod
-    def select_analysis_methods(
-        categories: List[IndustryCategoryInfo]
-    ) -> List[AnalysisMethod]:
-        """
-        분류된 업종에 따라 최적의 분석 기법 2개 선택
-        
-        Args:
-            categories: 분류된 업종 카테고리들
-            
-        Returns:
-            List[AnalysisMethod]: 선택된 분석 기법 정확히 2개
-        """
-        selected = []
-        
-        if not categories:
-            # 카테고리가 없으면 범용 기법 반환
-            return [AnalysisMethod.SWOT, AnalysisMethod.LEAN_CANVAS]
-        
-        # 첫 번째 카테고리의 대표 기법 선택
-        first_category_methods = INDUSTRY_METHODS.get(categories[0].category_id, [])
-        if first_category_methods:
-            selected.append(first_category_methods[0])
-        
-        # 두 번째 기법 선택
-        if len(categories) > 1:
-            # 두 번째 카테고리가 있으면 그 카테고리의 대표 기법 선택
-            second_category_methods = INDUSTRY_METHODS.get(categories[1].category_id, [])
-            for method in second_category_methods:
-                if method not in selected:
-                    selected.append(method)
-                    break
-        else:
-            # 카테고리가 1개만 있으면 해당 카테고리의 두 번째 기법 선택
-            if len(first_category_methods) > 1:
-                selected.append(first_category_methods[1])
-        
-        # 아직 2개가 안 되면 첫 번째 카테고리의 나머지 기법에서 선택
-        if len(selected) < 2 and first_category_methods:
-            for method in first_category_methods:
-                if method not in selected:
-                    selected.append(method)
-                    if len(selected) == 2:
-                        break
+    def _scan_keywords(text: str) -> Iterator[Tuple[int, tuple]]:
+        """(매칭 위치, 매칭 키워드의 소유 업종들) 순회"""
+        return _AC.iter(text)
+else:
+    # 정규식 교대(alternation) 매처: 전방탐색으로 모든 시작 위치를 C 엔진에서 한 번에 탐색
+    # 같은 위치에서는 가장 긴 키워드만 잡히므로, 그 키워드의 접두사 키워드도 함께 인정
+    _KEYWORD_PATTERN = re.compile("(?=(" + "|".join(
+        re.escape(keyword)
+        for keyword in sorted(_KEYWORD_OWNERS, key=len, reverse=True)
+    ) + "))")
+    _PREFIX_OWNERS = {
+        keyword: tuple(
+            owner
+            for prefix, owners in _KEYWORD_OWNERS.items() if keyword.startswith(prefix)
+            for owner in owners
+        )
+        for keyword in _KEYWORD_OWNERS
+    }
+    
+    def _scan_keywords(text: str) -> Iterator[Tuple[int, tuple]]:
+        """(매칭 위치, 매칭 키워드의 소유 업종들) 순회"""
+        for match in _KEYWORD_PATTERN.finditer(text):
+            yield match.start(), _PREFIX_OWNERS[match.group(1)]
+
+
+# 업종 기법으로 2개를 채우지 못할 때 사용하는 범용 기법
+_FALLBACK_METHODS = (
+    AnalysisMethod.SWOT,
+    AnalysisMethod.LEAN_CANVAS,
+    AnalysisMethod.CJM,
+)
+
+# 일괄 분류 시 설명 사이에 넣는 구분자 (어떤 키워드에도 포함되지 않음)
+_BATCH_SEPARATOR = "\x01"
+
+# 스레드별로 재사용하는 분류 버퍼 (매칭 수 / 매칭 키워드)
+_tls = threading.local()
+
+
+def _get_scan_buffers() -> Tuple[array, List[List[str]]]:
+    """현재 스레드의 분류 버퍼를 비워서 반환 (없으면 생성)"""
+    buffers = getattr(_tls, "buffers", None)
+    if buffers is None:
+        buffers = (array('i', [0] * N_CATEGORIES), [[] for _ in range(N_CATEGORIES)])
+        _tls.buffers = buffers
+    
+    counts, hits = buffers
+    for i in range(N_CATEGORIES):
+        counts[i] = 0
+        hits[i].clear()
+    return counts, hits
+
+
+def _top_two_categories(counts: Sequence[int]) -> Tuple[Tuple[int, int], ...]:
+    """업종별 매칭 수 배열에서 신뢰도 상위 2개 (업종 ID, 신뢰도) 선택"""
+    # 한 번의 순회로 선택 (동점이면 먼저 정의된 업종 우선)
+    best1 = best2 = (-1, None)
+    for cat_id, count in enumerate(counts):
+        if not count:
+            continue
+        confidence = min(count * 15, 95)  # 최대 95%
+        if confidence > best1[0]:
+            best2 = best1
+            best1 = (confidence, cat_id)
+        elif confidence > best2[0]:
+            best2 = (confidence, cat_id)
+    
+    # 매칭된 카테고리가 없으면 범용 비즈니스로 분류
+    if best1[1] is None:
+        best1 = (50, CAT_IDS[IndustryCategory.GENERAL_BUSINESS])
+    
+    return tuple(
+        (cat_id, confidence)
+        for confidence, cat_id in (best1, best2) if cat_id is not None
+    )
+
+
+@lru_cache(maxsize=2048)
+def _classify_impl(description_lower: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    소문자 사업 설명 → ((업종 ID, 신뢰도), ...) 상위 2개 (동일 입력은 캐시 반환)
+    
+    Args:
+        description_lower: 소문자로 변환된 사업 설명
         
-        # 그래도 부족하면 범용 기법 추가
-        if len(selected) < 2:
-            fallback_methods = [
-                AnalysisMethod.SWOT, 
-                AnalysisMethod.LEAN_CANVAS,
-                AnalysisMethod.CJM
-            ]
-            for method in fallback_methods:
-                if method not in selected:
-                    selected.append(method)
-                    if len(selected) == 2:
-                        break
+    Returns:
+        Tuple: 신뢰도 순 (업종 ID, 신뢰도) 튜플 (최대 2개)
+    """
+    # 업종 ID로 인덱싱하는 고정 크기 배열 (매칭 수 / 매칭 키워드, 스레드별 재사용)
+    counts, hits = _get_scan_buffers()
+    
+    # 사업 설명을 한 번만 순회하며 모든 키워드 매칭
+    for _, owners in _scan_keywords(description_lower):
+        for cat_id, keyword in owners:
+            if keyword not in hits[cat_id]:
+                hits[cat_id].append(keyword)
+                counts[cat_id] += 1
+    
+    return _top_two_categories(counts)
+
+
+def classify_business(business_description: str) -> List[IndustryCategoryInfo]:
+    """
+    사업 내용을 분석하여 적합한 업종 카테고리를 분류
+    
+    Args:
+        business_description: 사업 내용 설명
         
-        # 정확히 2개만 반환 (안전장치)
-        return selected[:2] if len(selected) >= 2 else selected + [AnalysisMethod.SWOT, AnalysisMethod.LEAN_CANVAS][:2-len(selected)]
-    
-    @staticmethod
-    def generate_classification_reasoning(
-        business_description: str,
-        categories: List[IndustryCategoryInfo],
-        methods: List[AnalysisMethod]
-    ) -> str:
-        """
-        분류 근거 설명 생성
+    Returns:
+        List[IndustryCategoryInfo]: 매칭된 업종 카테고리 (최대 2개, 신뢰도 순)
+    """
+    return _to_category_infos(_classify_impl(business_description.lower()))
+
+
+def classify_business_batch(
+    business_descriptions: List[str]
+) -> List[List[IndustryCategoryInfo]]:
+    """
+    여러 사업 설명을 한 번의 오토마톤 순회로 일괄 분류
+    
+    Args:
+        business_descriptions: 사업 내용 설명 목록
         
-        Args:
-            business_description: 사업 내용
-            categories: 분류된 카테고리
-            methods: 선택된 분석 기법
-            
-        Returns:
-            str: 분류 근거 설명
-        """
-        reasoning_parts = []
+    Returns:
+        List[List[IndustryCategoryInfo]]: 입력 순서대로 각 설명의 분류 결과
+    """
+    # 키워드에 없는 구분자로 이어 붙여 경계를 넘는 매칭 방지
+    lowered = [description.lower() for description in business_descriptions]
+    combined = _BATCH_SEPARATOR.join(lowered)
+    
+    # 각 설명의 시작 위치 (매칭 위치 → 설명 인덱스 역추적용)
+    starts = []
+    offset = 0
+    for description in lowered:
+        starts.append(offset)
+        offset += len(description) + len(_BATCH_SEPARATOR)
+    
+    counts = [[0] * N_CATEGORIES for _ in lowered]
+    hits = [[[] for _ in range(N_CATEGORIES)] for _ in lowered]
+    
+    for position, owners in _scan_keywords(combined):
+        row = bisect_right(starts, position) - 1
+        for cat_id, keyword in owners:
+            if keyword not in hits[row][cat_id]:
+                hits[row][cat_id].append(keyword)
+                counts[row][cat_id] += 1
+    
+    return [_to_category_infos(_top_two_categories(row)) for row in counts]
+
+
+def _to_category_infos(
+    ranked: Tuple[Tuple[int, int], ...]
+) -> List[IndustryCategoryInfo]:
+    """(업종 ID, 신뢰도) 튜플을 IndustryCategoryInfo 목록으로 변환"""
+    result = []
+    for cat_id, confidence in ranked:
+        result.append(IndustryCategoryInfo(
+            category_id=INDUSTRY_CATEGORIES[cat_id],
+            category_name=INDUSTRY_NAMES_ARR[cat_id],
+            confidence_score=confidence
+        ))
+    
+    return result
+
+
+def select_analysis_methods(
+    categories: List[IndustryCategoryInfo]
+) -> List[AnalysisMethod]:
+    """
+    분류된 업종에 따라 최적의 분석 기법 2개 선택
+    
+    Args:
+        categories: 분류된 업종 카테고리들
         
-        # 업종 분류 근거
-        if len(categories) == 1:
-            reasoning_parts.append(
-                f"귀하의 사업은 '{categories[0].category_name}' 업종으로 분류되었습니다 "
-                f"(신뢰도: {categories[0].confidence_score:.0f}%)."
-            )
-        else:
-            reasoning_parts.append(
-                f"귀하의 사업은 '{categories[0].category_name}'과(와) "
-                f"'{categories[1].category_name}'의 융합 업종으로 분류되었습니다."
-            )
+    Returns:
+        List[AnalysisMethod]: 선택된 분석 기법 정확히 2개
+    """
+    if not categories:
+        # 카테고리가 없으면 범용 기법 반환
+        return [AnalysisMethod.SWOT, AnalysisMethod.LEAN_CANVAS]
+    
+    # 고정 2칸 결과 배열과 선택된 기법 비트마스크
+    out = [None, None]
+    n = 0
+    mask = 0
+    
+    # 첫 번째 카테고리의 대표 기법 선택
+    first_category = categories[0].category_id
+    first_method = FIRST_METHOD.get(first_category)
+    if first_method is not None:
+        out[n] = first_method
+        n += 1
+        mask |= METHOD_BIT[first_method]
+    
+    # 두 번째 기법 선택
+    if len(categories) > 1:
+        # 두 번째 카테고리가 있으면 그 카테고리의 대표 기법 선택 (중복이면 두 번째 기법)
+        second_category = categories[1].category_id
+        method = FIRST_METHOD.get(second_category)
+        if method is not None and mask & METHOD_BIT[method]:
+            method = SECOND_METHOD.get(second_category)
+    else:
+        # 카테고리가 1개만 있으면 해당 카테고리의 두 번째 기법 선택
+        method = SECOND_METHOD.get(first_category)
+    if method is not None:
+        out[n] = method
+        n += 1
+        mask |= METHOD_BIT[method]
+        if n == 2:
+            return out
+    
+    # 아직 2개가 안 되면 첫 번째 카테고리의 나머지 기법, 그래도 부족하면 범용 기법에서 선택
+    for method in INDUSTRY_METHODS.get(first_category, ()) + _FALLBACK_METHODS:
+        if not mask & METHOD_BIT[method]:
+            out[n] = method
+            n += 1
+            mask |= METHOD_BIT[method]
+            if n == 2:
+                return out
+    
+    return out
+
+
+def generate_classification_reasoning(
+    business_description: str,
+    categories: List[IndustryCategoryInfo],
+    methods: List[AnalysisMethod]
+) -> str:
+    """
+    분류 근거 설명 생성
+    
+    Args:
+        business_description: 사업 내용
+        categories: 분류된 카테고리
+        methods: 선택된 분석 기법
         
-        # 선택된 분석 기법 설명
-        method_names = [method.value for method in methods]
-        reasoning_parts.append(
-            f"\n\n이에 따라 {', '.join(method_names)} 기법을 사용하여 "
-            f"리스크를 분석합니다."
+    Returns:
+        str: 분류 근거 설명
+    """
+    # 업종 분류 근거
+    if len(categories) == 1:
+        header = (
+            f"귀하의 사업은 '{categories[0].category_name}' 업종으로 분류되었습니다 "
+            f"(신뢰도: {categories[0].confidence_score:.0f}%)."
         )
-        
-        # 각 기법이 왜 선택되었는지 간단히 설명
-        from .constants import METHOD_DESCRIPTIONS
-        reasoning_parts.append("\n\n선택된 분석 기법:")
-        for i, method in enumerate(methods, 1):
-            description = METHOD_DESCRIPTIONS.get(method, "")
-            reasoning_parts.append(f"\n{i}. {method.value}: {description}")
-        
-        return "".join(reasoning_parts)
+    else:
+        header = (
+            f"귀하의 사업은 '{categories[0].category_name}'과(와) "
+            f"'{categories[1].category_name}'의 융합 업종으로 분류되었습니다."
+        )
+    
+    # 기법별 (이름, 설명)을 한 번만 계산해 두 곳에서 재사용
+    method_info = [
+        (METHOD_VALUE[method], METHOD_DESCRIPTIONS.get(method, ""))
+        for method in methods
+    ]
+    names = ", ".join(name for name, _ in method_info)
+    method_lines = "".join(
+        f"\n{i}. {name}: {description}"
+        for i, (name, description) in enumerate(method_info, 1)
+    )
+    
+    return (
+        f"{header}\n\n이에 따라 {names} 기법을 사용하여 리스크를 분석합니다."
+        f"\n\n선택된 분석 기법:{method_lines}"
+    )
+
+
+class IndustryClassifier:
+    """업종 분류 로직 (기존 호출부 호환용 네임스페이스)"""
+    
+    classify_business = staticmethod(classify_business)
+    select_analysis_methods = staticmethod(select_analysis_methods)
+    generate_classification_reasoning = staticmethod(generate_classification_reasoning)
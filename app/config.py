@@ -1,3 +1,5 @@
+from functools import lru_cache
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from typing import Optional
 import os
@@ -15,11 +17,60 @@ class Settings(BaseSettings):
     
     # 환경
     environment: str = "development"
+    log_level: str = "INFO"
+    
+    # Gemini 작업별 모델 (입력 검증은 경량 모델 사용)
+    gemini_validation_model: str = "gemini-2.5-flash-lite"
+    gemini_question_model: str = "gemini-2.5-flash"
+    gemini_report_model: str = "gemini-2.5-flash"
+    
+    # 질문 중복 제거 (임베딩 모델 / 코사인 유사도 임계값, 1.0 이상이면 생략)
+    gemini_embedding_model: str = "models/text-embedding-004"
+    question_dedup_threshold: float = 0.88
+    
+    # 업종 키워드가 2개 이상 매칭되면 입력 검증 API 호출 생략
+    validation_local_shortcut: bool = True
+    
+    # 의미가 거의 같은 입력의 검증 결과 재사용 (임베딩 코사인 유사도 임계값, 1.0 이상이면 생략 / 보관 수)
+    validation_semantic_threshold: float = 0.92
+    validation_semantic_cache_size: int = 256
+    
+    # 입력 검증과 동시에 질문 생성을 미리 시작 (검증 실패 시 취소, 비용 민감 환경에서는 끄기)
+    speculative_questions: bool = True
+    
+    # Gemini 호출 제어 (동시 호출 수 / 일시적 오류 재시도 총 시간(초))
+    # 동시 호출 수는 보고서 스트리밍(절반)과 나머지 비동기 호출에 나눠 배분하므로 2 이상
+    gemini_max_concurrency: int = Field(16, ge=2)
+    gemini_retry_timeout: float = 60.0
+    
+    # 서버 시작 시 Gemini 연결 미리 준비 (토큰 수 계산 호출, 생성 비용 없음)
+    gemini_warmup: bool = True
+    
+    # LLM 응답 캐시 (작업별 최대 항목 수 / 유효 시간(초))
+    llm_cache_max_entries: int = 1024
+    llm_cache_ttl_seconds: float = 7 * 24 * 3600
+    
+    # 서버가 계산한 보고서 값(손실 분석·종합 점수)은 pydantic 검증 없이 모델 생성 (외부 입력·Gemini 응답은 항상 검증)
+    trusted_internal_models: bool = True
+    
+    # 세션 저장소 (redis_url이 있으면 Redis에 저장하여 워커 간 공유 / 세션 유효 시간(초) / 인메모리 최대 세션 수)
+    redis_url: str = ""
+    session_ttl_seconds: int = 3600
+    max_sessions: int = 10000
+    
+    # 업종 키워드 매처 (aho_corasick / regex)
+    keyword_matcher: str = "aho_corasick"
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 인스턴스 반환 (.env 파싱은 프로세스당 1회)"""
+    return Settings()
+
+
 # 전역 설정 인스턴스
-settings = Settings()
+settings = get_settings()
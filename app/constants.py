@@ -1,66 +1,105 @@
-from typing import Dict, List
+import sys
+from typing import Dict, List, Optional, Tuple
 from .models import IndustryCategory, AnalysisMethod
 
 
+# 업종 카테고리 정수 ID (enum 정의 순서)
+INDUSTRY_CATEGORIES: Tuple[IndustryCategory, ...] = tuple(IndustryCategory)
+CAT_IDS: Dict[IndustryCategory, int] = {
+    category: i for i, category in enumerate(INDUSTRY_CATEGORIES)
+}
+N_CATEGORIES = len(INDUSTRY_CATEGORIES)
+
+
+# 분석 기법 표시명 (Enum .value 조회 없이 사용, intern 처리)
+METHOD_VALUE: Dict[AnalysisMethod, str] = {
+    method: sys.intern(method.value) for method in AnalysisMethod
+}
+
+
+# 분석 기법별 비트 (선택 여부를 정수 비트마스크로 추적)
+METHOD_BIT: Dict[AnalysisMethod, int] = {
+    method: 1 << i for i, method in enumerate(AnalysisMethod)
+}
+
+
 # 업종별 분석 기법 매핑
-INDUSTRY_METHODS: Dict[IndustryCategory, List[AnalysisMethod]] = {
-    IndustryCategory.EDUCATION: [
+INDUSTRY_METHODS: Dict[IndustryCategory, Tuple[AnalysisMethod, ...]] = {
+    IndustryCategory.EDUCATION: (
         AnalysisMethod.LOGIC_MODEL,
         AnalysisMethod.SMART_GOAL,
         AnalysisMethod.CJM,
-    ],
-    IndustryCategory.IT_STARTUP: [
+    ),
+    IndustryCategory.IT_STARTUP: (
         AnalysisMethod.LEAN_CANVAS,
         AnalysisMethod.SWOT,
         AnalysisMethod.CJM,
         AnalysisMethod.FIVE_WHY,
-    ],
-    IndustryCategory.MANUFACTURING: [
+    ),
+    IndustryCategory.MANUFACTURING: (
         AnalysisMethod.FMEA,
         AnalysisMethod.FTA,
         AnalysisMethod.HAZOP,
-    ],
-    IndustryCategory.MARKETING: [
+    ),
+    IndustryCategory.MARKETING: (
         AnalysisMethod.STP,
         AnalysisMethod.FOUR_P,
         AnalysisMethod.PORTER_FIVE_FORCES,
         AnalysisMethod.SWOT,
-    ],
-    IndustryCategory.FINANCE: [
+    ),
+    IndustryCategory.FINANCE: (
         AnalysisMethod.VAR,
         AnalysisMethod.MONTE_CARLO,
         AnalysisMethod.SENSITIVITY_ANALYSIS,
-    ],
-    IndustryCategory.SERVICE: [
+    ),
+    IndustryCategory.SERVICE: (
         AnalysisMethod.SERVICE_BLUEPRINT,
         AnalysisMethod.SIPOC,
         AnalysisMethod.CJM,
-    ],
-    IndustryCategory.PROJECT_MANAGEMENT: [
+    ),
+    IndustryCategory.PROJECT_MANAGEMENT: (
         AnalysisMethod.RAID_LOG,
         AnalysisMethod.PERT_CPM,
         AnalysisMethod.RBS,
-    ],
-    IndustryCategory.GENERAL_BUSINESS: [
+    ),
+    IndustryCategory.GENERAL_BUSINESS: (
         AnalysisMethod.SWOT,
         AnalysisMethod.LEAN_CANVAS,
         AnalysisMethod.CJM,
-    ],
+    ),
 }
 
 
-# 업종 카테고리 한글명
+# 업종별 대표 기법 / 두 번째 기법 (없으면 None)
+FIRST_METHOD: Dict[IndustryCategory, AnalysisMethod] = {
+    category: methods[0] for category, methods in INDUSTRY_METHODS.items()
+}
+SECOND_METHOD: Dict[IndustryCategory, Optional[AnalysisMethod]] = {
+    category: methods[1] if len(methods) > 1 else None
+    for category, methods in INDUSTRY_METHODS.items()
+}
+
+
+# 업종 카테고리 한글명 (인터닝된 문자열)
 INDUSTRY_NAMES: Dict[IndustryCategory, str] = {
-    IndustryCategory.EDUCATION: "교육 / 학습 / 에듀테크",
-    IndustryCategory.IT_STARTUP: "IT / 앱 / 소프트웨어 / 스타트업",
-    IndustryCategory.MANUFACTURING: "제조 / 공장 / 설비 / 하드웨어",
-    IndustryCategory.MARKETING: "마케팅 / 광고 / 브랜딩 / 소비재",
-    IndustryCategory.FINANCE: "금융 / 투자 / 재무",
-    IndustryCategory.SERVICE: "서비스업 / 외식 / 프랜차이즈 / 숙박",
-    IndustryCategory.PROJECT_MANAGEMENT: "프로젝트 / 건설 / 공공사업 / 인프라",
-    IndustryCategory.GENERAL_BUSINESS: "기타 / 범용 비즈니스 / 아직 모르겠음",
+    category: sys.intern(name)
+    for category, name in (
+        (IndustryCategory.EDUCATION, "교육 / 학습 / 에듀테크"),
+        (IndustryCategory.IT_STARTUP, "IT / 앱 / 소프트웨어 / 스타트업"),
+        (IndustryCategory.MANUFACTURING, "제조 / 공장 / 설비 / 하드웨어"),
+        (IndustryCategory.MARKETING, "마케팅 / 광고 / 브랜딩 / 소비재"),
+        (IndustryCategory.FINANCE, "금융 / 투자 / 재무"),
+        (IndustryCategory.SERVICE, "서비스업 / 외식 / 프랜차이즈 / 숙박"),
+        (IndustryCategory.PROJECT_MANAGEMENT, "프로젝트 / 건설 / 공공사업 / 인프라"),
+        (IndustryCategory.GENERAL_BUSINESS, "기타 / 범용 비즈니스 / 아직 모르겠음"),
+    )
 }
 
+# 업종 ID(CAT_IDS) 순서로 나열한 한글명
+INDUSTRY_NAMES_ARR: Tuple[str, ...] = tuple(
+    INDUSTRY_NAMES[category] for category in INDUSTRY_CATEGORIES
+)
+
 
 # 업종 카테고리 키워드
 INDUSTRY_KEYWORDS: Dict[IndustryCategory, List[str]] = {
@@ -95,6 +134,13 @@ INDUSTRY_KEYWORDS: Dict[IndustryCategory, List[str]] = {
 }
 
 
+# 소문자 키워드 → (업종, 원본 키워드) 역매핑
+KEYWORD_TO_CATEGORIES: Dict[str, List[Tuple[IndustryCategory, str]]] = {}
+for _category, _keywords in INDUSTRY_KEYWORDS.items():
+    for _keyword in _keywords:
+        KEYWORD_TO_CATEGORIES.setdefault(_keyword.lower(), []).append((_category, _keyword))
+
+
 # 분석 기법 설명
 METHOD_DESCRIPTIONS: Dict[AnalysisMethod, str] = {
     AnalysisMethod.LOGIC_MODEL: "교육 성과를 Input→Outcome 구조로 분석",
@@ -1,8 +1,695 @@
+import asyncio
+import copy
+import json
+import logging
+import math
 import os
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from collections import deque
+from contextlib import closing
+from functools import lru_cache
+from operator import mul
+from typing import List, Dict, Any, Deque, Iterator, Optional, Tuple, Union
 import google.generativeai as genai
-from .models import AnalysisMethod, Question, Answer
-from .constants import METHOD_DESCRIPTIONS
+from google.generativeai import protos
+from google.generativeai.types import generation_types
+from google.api_core import exceptions as google_exceptions
+from google.api_core import retry as google_retry
+from google.api_core import retry_async as google_retry_async
+from .models import (
+    AnalysisMethod,
+    IndustryCategory,
+    Question,
+    Answer,
+    GeneratedQuestionList,
+    GeneratedQuestionSet,
+    BusinessValidationResult,
+)
+from .constants import METHOD_DESCRIPTIONS, METHOD_VALUE
+from .classifier import classify_business
+from .config import settings
+from .llm_cache import LLMCache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _json_loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치 시 정규식 매처 사용
+    ahocorasick = None
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _configure_api(api_key: str) -> None:
+    """genai 전역 클라이언트 설정 (키가 바뀔 때만 재설정하여 인스턴스 간 gRPC 채널 공유)"""
+    genai.configure(api_key=api_key)
+
+
+def _response_schema(model_class: type) -> protos.Schema:
+    """pydantic 모델을 Gemini response_schema로 변환 (import 시 1회)"""
+    return generation_types.to_generation_config_dict(
+        {"response_schema": model_class}
+    )["response_schema"]
+
+
+# Gemini JSON 모드 응답 스키마
+_QUESTION_LIST_SCHEMA = _response_schema(GeneratedQuestionList)
+_QUESTION_SET_SCHEMA = _response_schema(GeneratedQuestionSet)
+_VALIDATION_SCHEMA = _response_schema(BusinessValidationResult)
+
+
+# 작업별 생성 설정 (모델 생성 시 바인딩, 호출마다 dict를 만들지 않음)
+_VALIDATION_CONFIG = {
+    'temperature': 0.0,
+    'max_output_tokens': 256,
+    'response_mime_type': 'application/json',
+    'response_schema': _VALIDATION_SCHEMA,
+}
+_QUESTION_SET_CONFIG = {
+    'temperature': 0.7,
+    'max_output_tokens': 3500,
+    'response_mime_type': 'application/json',
+    'response_schema': _QUESTION_SET_SCHEMA,
+}
+# 기법별 폴백 호출용 (question_model의 기본 설정을 호출 시 덮어씀)
+_QUESTION_LIST_CONFIG = {
+    'temperature': 0.7,
+    'max_output_tokens': 2000,
+    'response_mime_type': 'application/json',
+    'response_schema': _QUESTION_LIST_SCHEMA,
+}
+_REPORT_CONFIG = {
+    'temperature': 0.5,
+    'max_output_tokens': 4000,
+}
+
+
+def _unit_vector(embedding: List[float]) -> List[float]:
+    """임베딩을 단위 벡터로 정규화 (내적 = 코사인 유사도)"""
+    norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+    return [x / norm for x in embedding]
+
+
+def _to_qa_pairs(
+    questions: List[Question],
+    qa_map: Dict[str, str]
+) -> Tuple[Tuple[str, str, str], ...]:
+    """질문과 답변을 질문 순서대로 (기법명, 질문 내용, 답변) 튜플로 결합 (답변이 없으면 '답변 없음')"""
+    return tuple(
+        (METHOD_VALUE[q.method], q.question_text, qa_map.get(q.question_id, '답변 없음'))
+        for q in questions
+    )
+
+
+def _to_qa_map(answers: Union[List[Answer], Dict[str, str]]) -> Dict[str, str]:
+    """답변 목록을 질문 ID → 답변 매핑으로 변환 (이미 매핑이면 그대로 반환)"""
+    if isinstance(answers, dict):
+        return answers
+    return {answer.question_id: answer.answer for answer in answers}
+
+
+# 재시도할 일시적 API 오류 (429 / 5xx / 타임아웃)
+_RETRYABLE_ERRORS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
+
+# OSD 보고서 텍스트 형식 (줄 단위)
+_RISK_LINE_RE = re.compile(
+    r'^리스크\s*\d*\s*:\s*(.*?)\s*\|\s*O\s*=\s*(\d+)\s*\|\s*S\s*=\s*(\d+)\s*\|\s*D\s*=\s*(\d+)'
+)
+_RECOMMENDATION_LINE_RE = re.compile(r'^조언\s*\d*\s*:\s*(.*)$')
+_LABEL_PREFIX_RE = re.compile(r'^\[?\s*(?:우선순위|난이도)\s*:\s*')
+# 질문 한 줄 형식 (Q1: 질문 | 유형 | 선택지)
+_Q_LINE_RE = re.compile(
+    r'^[ \t\r]*Q\d*[ \t\r]*:[ \t\r]*([^|\n]*?)[ \t\r]*(?:\|[ \t\r]*([^|\n]*?)[ \t\r]*(?:\|[ \t\r]*([^|\n]*?))?[ \t\r]*(?:\|[^\n]*)?)?$',
+    re.MULTILINE
+)
+_QUESTION_TYPES = ("text", "number", "choice")
+
+# 입력 검증 응답 형식 (VALID / MESSAGE / SUGGESTION)
+_VALIDATION_LINE_RE = re.compile(
+    r'^[ \t\r]*(VALID|MESSAGE|SUGGESTION):[ \t\r]*(.*?)[ \t\r]*$',
+    re.MULTILINE
+)
+
+# 통합 질문 응답의 기법 구분선 (=== METHOD 1: SWOT ===)
+_METHOD_SECTION_RE = re.compile(r'^[\s*#=]*METHOD\s*(\d+)\b[^\n]*$', re.MULTILINE)
+_PRIORITIES = ("높음", "중간", "낮음")
+_DIFFICULTIES = ("쉬움", "보통", "어려움")
+
+
+# 입력 검증 폴백용 비즈니스 키워드 (import 시 매처 1회 구성)
+_BUSINESS_KEYWORDS = (
+    "사업", "창업", "서비스", "제품", "플랫폼", "앱", "웹사이트",
+    "고객", "시장", "판매", "유통", "제조", "개발", "솔루션",
+    "비즈니스", "스타트업", "기업", "회사", "매출", "수익"
+)
+
+if ahocorasick is not None and settings.keyword_matcher == "aho_corasick":
+    _BUSINESS_AC = ahocorasick.Automaton()
+    for _keyword in _BUSINESS_KEYWORDS:
+        _BUSINESS_AC.add_word(_keyword, _keyword)
+    _BUSINESS_AC.make_automaton()
+    
+    def _has_business_keyword(text: str) -> bool:
+        """비즈니스 키워드 포함 여부 (한 번의 선형 탐색)"""
+        return next(_BUSINESS_AC.iter(text), None) is not None
+    
+    def _count_business_keywords(text: str) -> int:
+        """포함된 서로 다른 비즈니스 키워드 수"""
+        return len({keyword for _, keyword in _BUSINESS_AC.iter(text)})
+else:
+    _BUSINESS_KEYWORD_RE = re.compile("|".join(map(re.escape, _BUSINESS_KEYWORDS)))
+    
+    def _has_business_keyword(text: str) -> bool:
+        """비즈니스 키워드 포함 여부 (한 번의 선형 탐색)"""
+        return _BUSINESS_KEYWORD_RE.search(text) is not None
+    
+    def _count_business_keywords(text: str) -> int:
+        """포함된 서로 다른 비즈니스 키워드 수"""
+        return len(set(_BUSINESS_KEYWORD_RE.findall(text)))
+
+
+# 입력 검증 로컬 통과 기준 (키워드 수 / 설명 길이), 나머지는 API로 검증
+_LOCAL_VALID_MIN_KEYWORDS = 2
+_LOCAL_VALID_MIN_LENGTH = 30
+
+
+# GPT API 실패 시 사용할 분석 기법별 기본 질문
+_FALLBACK_QUESTION_TEXTS: Dict[AnalysisMethod, Tuple[str, ...]] = {
+    AnalysisMethod.SWOT: (
+        "우리 사업의 가장 큰 강점은 무엇인가요?",
+        "우리 사업의 주요 약점은 무엇인가요?",
+        "시장에서 어떤 기회를 포착하고 있나요?",
+        "가장 큰 위협 요소는 무엇인가요?",
+        "경쟁사 대비 우리의 차별점은 무엇인가요?"
+    ),
+    AnalysisMethod.LEAN_CANVAS: (
+        "해결하려는 고객의 핵심 문제는 무엇인가요?",
+        "목표 고객 세그먼트는 누구인가요?",
+        "제공하는 고유한 가치는 무엇인가요?",
+        "주요 수익원은 무엇인가요?",
+        "핵심 비용 구조는 어떻게 되나요?"
+    ),
+}
+_DEFAULT_FALLBACK_QUESTION_TEXTS: Tuple[str, ...] = (
+    "사업의 핵심 목표는 무엇인가요?",
+    "주요 고객층은 누구인가요?",
+    "예상되는 주요 리스크는 무엇인가요?",
+    "경쟁 환경은 어떠한가요?",
+    "성공의 핵심 요소는 무엇인가요?"
+)
+
+
+# 폴백 보고서 기법별 샘플 OSD 리스크 (O, S, D, 리스크 유형)
+_FALLBACK_RISK_TEMPLATES: Tuple[Tuple[int, int, int, str], ...] = (
+    (7, 8, 6, "시장 경쟁 리스크"),
+    (5, 9, 7, "운영 리스크"),
+    (6, 6, 5, "재무 리스크"),
+)
+_FALLBACK_KEY_FINDINGS_TAIL: Tuple[str, ...] = (
+    "개선이 필요한 영역이 명확히 파악되었습니다",
+    "단계적 리스크 완화 전략이 필요합니다"
+)
+
+# 폴백 보고서 AI 조언 (호출마다 dict 복사본 반환)
+_FALLBACK_AI_RECOMMENDATIONS: Tuple[Dict[str, str], ...] = (
+    {
+        "category": "시장 검증",
+        "priority": "높음",
+        "action": "초기 고객 인터뷰를 통한 문제-해결책 적합도 재검증",
+        "expected_impact": "제품-시장 적합성 향상 및 피벗 리스크 감소",
+        "implementation_difficulty": "쉬움"
+    },
+    {
+        "category": "MVP 개발",
+        "priority": "높음",
+        "action": "핵심 기능만 포함한 최소 기능 제품(MVP) 우선 출시",
+        "expected_impact": "개발 비용 절감 및 빠른 시장 피드백",
+        "implementation_difficulty": "보통"
+    },
+    {
+        "category": "재무 관리",
+        "priority": "중간",
+        "action": "월별 번다운(Burn Rate) 모니터링 시스템 구축",
+        "expected_impact": "자금 소진 리스크 조기 감지",
+        "implementation_difficulty": "쉬움"
+    },
+    {
+        "category": "팀 역량",
+        "priority": "중간",
+        "action": "핵심 기술 스택에 대한 팀 교육 및 역량 강화",
+        "expected_impact": "개발 속도 향상 및 기술 부채 감소",
+        "implementation_difficulty": "보통"
+    },
+    {
+        "category": "고객 피드백",
+        "priority": "높음",
+        "action": "사용자 피드백 수집 자동화 시스템 도입",
+        "expected_impact": "제품 개선 속도 향상 및 이탈 방지",
+        "implementation_difficulty": "쉬움"
+    },
+)
+
+_FALLBACK_EXECUTIVE_SUMMARY = """
+이 사업은 중간 수준의 리스크를 보이고 있으며, 체계적인 준비를 통해 충분히 관리 가능합니다.
+
+주요 리스크는 시장 경쟁 강도와 초기 고객 확보에 집중되어 있으나, 적절한 MVP 전략과
+고객 피드백 루프를 구축한다면 성공 확률을 크게 높일 수 있습니다.
+
+투자금액 대비 리스크를 고려할 때, 단계적 투자 집행과 주요 마일스톤 달성 시점에서의
+재평가가 권장됩니다.
+""".strip()
+
+
+# 입력 검증 시스템 지시문 (판단 기준 + 출력 형식 + 예시, 사용자 입력은 요청 끝에만 위치)
+_VALIDATION_SYSTEM_INSTRUCTION = """당신은 비즈니스 아이디어를 정확하게 검증하는 전문가입니다. 주어진 형식을 엄격히 따라 답변해주세요.
+
+사용자 입력이 비즈니스 아이디어나 사업 계획과 관련된 내용인지 판단해주세요.
+
+**판단 기준:**
+- 비즈니스/사업 관련 내용: 제품, 서비스, 창업, 사업 모델, 고객, 시장 등의 키워드 포함
+- 관련 없는 내용: 일상 대화, 날씨, 음식, 일반적인 질문 등
+
+**출력 형식 (JSON):**
+- is_valid: 비즈니스 아이디어이면 true, 아니면 false
+- message: 사용자에게 보여줄 메시지
+- suggestion: true인 경우 빈 문자열, false인 경우 올바른 입력 예시 제공
+
+예시 1:
+{"is_valid": true, "message": "비즈니스 아이디어가 확인되었습니다.", "suggestion": ""}
+
+예시 2:
+{"is_valid": false, "message": "비즈니스 아이디어를 구체적으로 입력해주세요.", "suggestion": "예: '온라인 중고 도서 거래 플랫폼 서비스', 'AI 기반 맞춤형 학습 관리 시스템', '친환경 배달 용기 렌탈 사업'"}"""
+
+
+# 질문 생성 시스템 지시문 (호출마다 바이트 단위로 동일한 고정 접두부 → 암묵적 프롬프트 캐시 적중)
+_QUESTION_SYSTEM_INSTRUCTION = """당신은 비즈니스 리스크 분석 전문가이자 창업 컨설턴트입니다. 사업의 리스크를 파악하기 위한 핵심 질문들을 생성해주세요.
+
+**중요 규칙:**
+1. 사용자가 설명한 사업 내용을 반드시 질문에 직접 언급하세요
+   예시: "교육 앱" 사업이라면 → "앱에서 제공할 강의는 누가 만드나요?"
+   예시: "카페" 사업이라면 → "카페 위치는 어디이며, 하루 예상 손님 수는 몇 명인가요?"
+
+2. 일반적인 질문 절대 금지:
+   ❌ "사업의 핵심 목표는 무엇인가요?"
+   ❌ "주요 고객층은 누구인가요?"
+   ❌ "예상되는 주요 리스크는 무엇인가요?"
+   ❌ "해결하려는 핵심 문제는 무엇인가요?"
+   이런 질문들은 모든 사업에 다 해당하므로 절대 사용하지 마세요!
+
+3. 분석 기법마다 정확히 2~3개의 질문만 생성하세요
+
+4. 각 질문은 설명된 사업에만 해당하는 구체적인 내용이어야 합니다
+
+**출력 형식 (JSON):**
+각 질문은 다음 필드로 작성하세요:
+- question_text: 질문 내용
+- question_type: 답변 유형 (text, number, choice 중 하나)
+- choices: question_type이 choice인 경우 선택지 목록, 아니면 null
+
+예: {"question_text": "앱의 수익 모델은 무엇인가요?", "question_type": "choice", "choices": ["광고", "구독", "수수료"]}
+
+분석 기법이 여러 개 주어지면 sections 배열에 기법 순서대로 method_number(1부터)와 questions를 작성하세요."""
+
+
+# 보고서 생성 시스템 지시문 (전문가 페르소나 + OSD 방법론 + 출력 형식, 고정 접두부)
+_REPORT_SYSTEM_INSTRUCTION = """당신은 **FMEA(Failure Mode and Effects Analysis) 분야에서 20년 이상 경력을 쌓은 리스크 분석 전문가**입니다.
+
+자동차, 항공, 제조업 등 고신뢰성 산업에서 수천 건의 FMEA를 수행하며 OSD(Occurrence×Severity×Detection) 방법론의 대가가 되었습니다.
+
+또한 스타트업 생태계에서 **창업 멘토**로 활동하며, 비즈니스 리스크를 정량적으로 측정하고 
+실질적인 해결책을 제시하는 데 탁월한 능력을 발휘합니다.
+
+당신의 역할:
+1. OSD 점수를 정확하고 객관적으로 평가
+2. 경영진이 즉시 실행할 수 있는 구체적 조언 제공
+3. 리스크를 우선순위화하여 자원 배분 최적화
+4. 20년 경력자의 통찰력으로 숨겨진 리스크 발견
+
+전문가답게 신중하고 정확하게 분석해주세요.
+
+**OSD 방법론 설명:**
+- O (Occurrence): 발생 가능성 (1~10, 높을수록 발생하기 쉬움)
+- S (Severity): 심각도 (1~10, 높을수록 피해가 큼)
+- D (Detection): 발견 가능성 (1~10, 낮을수록 발견하기 어려움)
+- Risk Score = O × S × D (1~1000)
+
+**업종·기법별 OSD 매핑 가이드:**
+- IT/스타트업 + Lean Canvas: 문제적합성→O, 경쟁대비차별성→S, 고객피드백루프→D
+- 교육 + Logic Model: Input부족→O, Outcome부진→S, Output측정시스템부재→D
+- 서비스업 + Blueprint: Frontstage혼잡→O, 고객클레임위험→S, Backstage대응력→D
+- 제조 + FMEA: FMEA 자체가 O/S/D 생성
+- 기본: 발생가능성→O, 심각도→S, 발견가능성→D
+
+**보고서 작성 요구사항:**
+
+1. **각 분석 기법별 OSD 리스크 분석**
+   사용자가 지정한 분석 기법 순서대로, 각 기법마다 3~5개의 주요 리스크를 다음 형식으로 작성:
+   
+   기법: [분석 기법명]
+   리스크1: [리스크 설명] | O=[1-10] | S=[1-10] | D=[1-10] | Score=[O×S×D]
+   리스크2: [리스크 설명] | O=[1-10] | S=[1-10] | D=[1-10] | Score=[O×S×D]
+   ...
+   주요발견: [핵심 인사이트]
+   
+   기법: [다음 분석 기법명]
+   (동일 형식)
+
+2. **AI 조언 (우선순위별)**
+   각 조언을 다음 형식으로:
+   
+   조언1: [카테고리] | [우선순위: 높음/중간/낮음] | [액션] | [예상효과] | [난이도: 쉬움/보통/어려움]
+   조언2: ...
+   (5~7개 조언)
+
+3. **경영진 요약**
+   - 사업의 핵심 리스크와 기회를 2~3문단으로 요약
+
+**작성 예시:**
+
+기법: Lean Canvas
+리스크1: 초기 사용자 확보 실패 | O=7 | S=8 | D=5 | Score=280
+리스크2: 수익 모델 불명확 | O=6 | S=9 | D=6 | Score=324
+주요발견: 고객 문제 검증이 부족합니다
+
+조언1: 시장 검증 | 높음 | 목표 고객 인터뷰 20건 수행 | 문제-해결 적합성 확인 | 쉬움
+조언2: 재무 | 중간 | 월별 현금 흐름표 작성 및 런웨이 관리 | 자금 리스크 감소 | 보통
+
+경영진 요약
+[2~3문단 요약]
+
+위 형식을 정확히 따라 숫자와 함께 작성해주세요."""
+
+
+class _OSDStreamParser:
+    """OSD 보고서 텍스트를 조각 단위로 받아 완성된 섹션부터 파싱하는 점진 파서"""
+    
+    def __init__(self, methods: List[AnalysisMethod]):
+        self.methods = methods
+        # 기법명 매칭용 소문자 기법명 (기법 순서대로 1회 계산)
+        self.method_names_lower = [METHOD_VALUE[method].lower() for method in methods]
+        self.buffer = ""
+        self.section = None
+        self.current = None
+        self.method_results: List[Dict[str, Any]] = []
+        self.recommendations: List[Dict[str, str]] = []
+        self.summary_lines: List[str] = []
+    
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """
+        응답 조각 추가
+        
+        Returns:
+            List[Dict]: 이번 조각으로 완성된 분석 기법별 결과
+        """
+        self.buffer += text
+        *lines, self.buffer = self.buffer.split("\n")
+        completed = []
+        for line in lines:
+            result = self._handle_line(line)
+            if result is not None:
+                completed.append(result)
+        return completed
+    
+    def close(self) -> List[Dict[str, Any]]:
+        """남은 버퍼를 처리하고 마지막 분석 기법 결과 반환"""
+        completed = []
+        if self.buffer:
+            result = self._handle_line(self.buffer)
+            self.buffer = ""
+            if result is not None:
+                completed.append(result)
+        result = self._flush_method()
+        if result is not None:
+            completed.append(result)
+        return completed
+    
+    def _handle_line(self, raw_line: str) -> Optional[Dict[str, Any]]:
+        """한 줄 처리 (분석 기법 블록이 끝나면 해당 결과 반환)"""
+        line = raw_line.strip().strip("*#->").strip()
+        
+        if line.startswith("기법:"):
+            finished = self._flush_method()
+            self.section = "method"
+            self.current = {
+                "method": self._resolve_method(line[len("기법:"):].strip().strip("*")),
+                "osd_risks": [],
+                "key_findings": []
+            }
+            return finished
+        
+        if "경영진 요약" in line:
+            finished = self._flush_method()
+            self.section = "summary"
+            _, _, rest = line.partition(":")
+            if rest.strip():
+                self.summary_lines.append(rest.strip())
+            return finished
+        
+        recommendation_match = _RECOMMENDATION_LINE_RE.match(line)
+        if recommendation_match:
+            finished = self._flush_method()
+            self.section = "recommendations"
+            recommendation = self._parse_recommendation(recommendation_match.group(1))
+            if recommendation is not None:
+                self.recommendations.append(recommendation)
+            return finished
+        
+        if self.section == "method" and self.current is not None:
+            risk_match = _RISK_LINE_RE.match(line)
+            if risk_match:
+                description, o, s, d = risk_match.groups()
+                o, s, d = (min(10, max(1, int(v))) for v in (o, s, d))
+                self.current["osd_risks"].append({
+                    "occurrence": o,
+                    "severity": s,
+                    "detection": d,
+                    "risk_score": o * s * d,
+                    "description": description.strip("[] ")
+                })
+            elif line.startswith(("주요발견:", "주요 발견:", "인사이트:")):
+                finding = line.split(":", 1)[1].strip()
+                if finding:
+                    self.current["key_findings"].append(finding)
+        elif self.section == "summary":
+            self.summary_lines.append(raw_line.strip())
+        
+        return None
+    
+    def _flush_method(self) -> Optional[Dict[str, Any]]:
+        """진행 중인 분석 기법 블록을 마무리 (리스크가 없으면 버림)"""
+        current, self.current = self.current, None
+        if current is None or current["method"] is None or not current["osd_risks"]:
+            return None
+        
+        current["method_specific_insights"] = " ".join(current["key_findings"])
+        self.method_results.append(current)
+        return current
+    
+    def _resolve_method(self, name: str) -> Optional[AnalysisMethod]:
+        """응답의 기법명을 AnalysisMethod로 매핑 (없으면 아직 나오지 않은 기법 순서대로)"""
+        used = {result["method"] for result in self.method_results}
+        name_lower = name.lower()
+        for method, value_lower in zip(self.methods, self.method_names_lower):
+            if method not in used and name_lower and (
+                value_lower in name_lower or name_lower in value_lower
+            ):
+                return method
+        for method in self.methods:
+            if method not in used:
+                return method
+        return None
+    
+    @staticmethod
+    def _parse_recommendation(body: str) -> Optional[Dict[str, str]]:
+        """'카테고리 | 우선순위 | 액션 | 예상효과 | 난이도' 형식의 조언 파싱"""
+        parts = [_LABEL_PREFIX_RE.sub("", part.strip()).strip("[] ") for part in body.split("|")]
+        if len(parts) < 5 or not parts[2]:
+            return None
+        
+        category, priority, action, expected_impact, difficulty = parts[:5]
+        return {
+            "category": category,
+            "priority": priority if priority in _PRIORITIES else "중간",
+            "action": action,
+            "expected_impact": expected_impact,
+            "implementation_difficulty": difficulty if difficulty in _DIFFICULTIES else "보통"
+        }
+
+
+# 업종별 질문 가이드 (감지 키워드 정규식, 가이드 템플릿), 앞쪽 업종이 우선
+_INDUSTRY_QUESTION_GUIDES = tuple(
+    (re.compile("|".join(map(re.escape, keywords))), template)
+    for keywords, template in (
+        (("앱", "소프트웨어", "플랫폼", "IT", "개발", "스타트업", "웹", "모바일"), """
+이 사업은 IT/앱 분야입니다. 이런 질문을 만드세요:
+✅ "{business_description}"를 개발할 개발자가 있나요? 몇 명이며 언제 완성되나요?
+✅ "{business_description}"와 비슷한 앱/서비스가 있나요? 이름이 뭐고 뭐가 다른가요?
+✅ 첫 달에 "{business_description}"를 사용할 사람이 몇 명 정도 될까요?
+"""),
+        (("교육", "학습", "강의", "학원", "에듀테크", "교육용"), """
+이 사업은 교육 분야입니다. 이런 질문을 만드세요:
+✅ "{business_description}"에서 가르칠 강사/선생님이 있나요? 몇 명인가요?
+✅ "{business_description}"의 수강료는 얼마이며, 한 달에 학생이 몇 명 필요한가요?
+✅ "{business_description}"를 통해 학습하면 어떤 결과가 나오나요? (성적? 자격증?)
+"""),
+        (("제조", "생산", "공장", "설비", "제품 생산", "양산"), """
+이 사업은 제조 분야입니다. 이런 질문을 만드세요:
+✅ "{business_description}" 제품을 만들 설비(기계)가 있나요? 얼마인가요?
+✅ 하루에 "{business_description}" 제품을 몇 개 만들 수 있나요?
+✅ "{business_description}" 제품의 불량률은 몇 %인가요?
+"""),
+        (("외식", "음식점", "카페", "레스토랑", "서비스", "매장", "가게"), """
+이 사업은 서비스/외식 분야입니다. 이런 질문을 만드세요:
+✅ "{business_description}" 가게 위치는 어디이며, 하루 유동인구는 몇 명인가요?
+✅ "{business_description}"에서 판매할 제품의 원가는 판매가의 몇 %인가요?
+✅ 근처에 "{business_description}"와 비슷한 가게가 몇 개 있나요?
+"""),
+        (("마케팅", "광고", "브랜드", "홍보", "프로모션"), """
+이 사업은 마케팅 분야입니다. 이런 질문을 만드세요:
+✅ "{business_description}"의 타겟 고객은 정확히 누구인가요? (나이, 성별, 직업)
+✅ "{business_description}" 광고 예산은 얼마이며, 어디에 쓸 건가요?
+✅ "{business_description}" 효과를 어떻게 측정할 건가요?
+"""),
+    )
+)
+
+_DEFAULT_QUESTION_GUIDE = """
+이런 질문을 만드세요:
+✅ "{business_description}"의 고객은 누구이며, 왜 우리를 선택해야 하나요?
+✅ "{business_description}"로 한 달에 얼마를 벌 수 있나요?
+✅ "{business_description}"와 경쟁하는 업체는 어디인가요?
+"""
+
+
+@lru_cache(maxsize=1024)
+def _industry_specific_context(business_description: str) -> str:
+    """업종별 특화된 질문 가이드 제공 (동일 입력은 캐시 반환)"""
+    concept_lower = business_description.lower()
+    
+    # 업종 감지 (업종마다 키워드 전체를 하나의 정규식으로 검색)
+    template = _DEFAULT_QUESTION_GUIDE
+    for pattern, guide in _INDUSTRY_QUESTION_GUIDES:
+        if pattern.search(concept_lower):
+            template = guide
+            break
+    
+    return template.replace("{business_description}", business_description)
+
+
+@lru_cache(maxsize=512)
+def _build_question_prompt(business_description: str) -> str:
+    """질문 생성을 위한 프롬프트 작성 (동일 입력은 캐시 반환)"""
+    
+    # 업종별 맞춤 가이드
+    industry_context = _industry_specific_context(business_description)
+    
+    # 규칙·출력 형식은 _QUESTION_SYSTEM_INSTRUCTION에 있으므로 사업별 내용만 작성
+    return f"""
+아래 사업을 분석 중입니다:
+"{business_description}"
+
+{industry_context}
+
+questions 배열에 정확히 2~3개의 질문만 작성하세요.
+
+지금 바로 "{business_description}" 사업을 위한 구체적인 질문을 만드세요!
+"""
+
+
+@lru_cache(maxsize=512)
+def _build_combined_question_prompt(
+    business_description: str,
+    methods: Tuple[AnalysisMethod, ...]
+) -> str:
+    """모든 분석 기법의 질문을 한 번에 생성하기 위한 프롬프트 작성 (동일 입력은 캐시 반환)"""
+    
+    # 업종별 맞춤 가이드
+    industry_context = _industry_specific_context(business_description)
+    
+    method_lines = "\n".join(
+        f"- {METHOD_VALUE[method]}: {METHOD_DESCRIPTIONS.get(method, '')}"
+        for method in methods
+    )
+    output_format = "\n".join(
+        f"- method_number {i+1}: {METHOD_VALUE[method]} 질문 2~3개"
+        for i, method in enumerate(methods)
+    )
+    
+    # 규칙·출력 형식은 _QUESTION_SYSTEM_INSTRUCTION에 있으므로 사업별 내용만 작성
+    return f"""
+아래 사업을 분석 중입니다:
+"{business_description}"
+
+분석 기법:
+{method_lines}
+
+{industry_context}
+
+**sections 작성 순서:**
+{output_format}
+
+지금 바로 "{business_description}" 사업을 위한 구체적인 질문을 만드세요!
+"""
+
+
+@lru_cache(maxsize=512)
+def _build_report_prompt(
+    business_name: str,
+    business_description: str,
+    investment_amount: Optional[int],
+    methods: Tuple[AnalysisMethod, ...],
+    qa_pairs: Tuple[Tuple[str, str, str], ...]
+) -> str:
+    """
+    리스크 보고서 생성 프롬프트 (동일 입력은 캐시 반환)
+    
+    Args:
+        qa_pairs: 질문 순서대로 (기법명, 질문 내용, 답변) 튜플
+    """
+    
+    # 질문-답변 포맷팅 (한 번의 join으로 결합)
+    qa_text = "\n".join(
+        f"[{method_value}] Q: {question_text}\nA: {answer}"
+        for method_value, question_text, answer in qa_pairs
+    )
+    method_values = [METHOD_VALUE[m] for m in methods]
+    
+    investment_info = f"{investment_amount:,}원" if investment_amount else "미정"
+    
+    # 작성할 기법 순서 (페르소나·OSD 방법론·출력 형식은 _REPORT_SYSTEM_INSTRUCTION에 있음)
+    method_headers = "\n".join(f"기법: {value}" for value in method_values)
+    
+    return f"""
+다음 사업에 대한 OSD 기반 종합 리스크 분석 보고서를 작성해주세요.
+
+**사업 정보:**
+- 사업명: {business_name}
+- 사업 내용: {business_description}
+- 투자금액: {investment_info}
+
+**사용된 분석 기법:**
+{', '.join(method_values)}
+
+**질문과 답변:**
+{qa_text}
+
+**작성할 분석 기법 (순서대로):**
+{method_headers}
+"""
 
 
 class GPTService:
@@ -17,7 +704,7 @@ class GPTService:
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
         
-        genai.configure(api_key=self.api_key)
+        _configure_api(self.api_key)
         
         # Safety settings - 비즈니스 분석 내용이 차단되지 않도록 설정
         from google.generativeai.types import HarmCategory, HarmBlockThreshold
@@ -29,14 +716,129 @@ class GPTService:
             HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
         }
         
-        self.model = genai.GenerativeModel(
-            'gemini-2.5-flash',
-            safety_settings=self.safety_settings
+        # 작업별 모델 이름 (입력 검증은 경량 모델, 보고서는 상위 모델로 라우팅 가능)
+        self.models = {
+            "validate": settings.gemini_validation_model,
+            "questions": settings.gemini_question_model,
+            "report": settings.gemini_report_model,
+        }
+        
+        # 고정 지시문을 system_instruction으로 분리한 작업별 모델 (요청마다 사용자 입력만 전송)
+        self.validation_model = genai.GenerativeModel(
+            self.models["validate"],
+            safety_settings=self.safety_settings,
+            generation_config=_VALIDATION_CONFIG,
+            system_instruction=_VALIDATION_SYSTEM_INSTRUCTION
+        )
+        self.question_model = genai.GenerativeModel(
+            self.models["questions"],
+            safety_settings=self.safety_settings,
+            generation_config=_QUESTION_SET_CONFIG,
+            system_instruction=_QUESTION_SYSTEM_INSTRUCTION
+        )
+        self.report_model = genai.GenerativeModel(
+            self.models["report"],
+            safety_settings=self.safety_settings,
+            generation_config=_REPORT_CONFIG,
+            system_instruction=_REPORT_SYSTEM_INSTRUCTION
+        )
+        
+        # 일시적 오류는 지수 백오프(지터 포함)로 재시도한 뒤에만 폴백으로 넘어감
+        retry_predicate = google_retry.if_exception_type(*_RETRYABLE_ERRORS)
+        self._request_options = {
+            "retry": google_retry.Retry(
+                predicate=retry_predicate,
+                initial=1.0,
+                maximum=20.0,
+                timeout=settings.gemini_retry_timeout
+            )
+        }
+        self._async_request_options = {
+            "retry": google_retry_async.AsyncRetry(
+                predicate=retry_predicate,
+                initial=1.0,
+                maximum=20.0,
+                timeout=settings.gemini_retry_timeout
+            )
+        }
+        
+        # 동시 API 호출 수 제한 (RPM/TPM 한도 보호, 비동기 세마포어는 이벤트 루프별로 생성)
+        # 상한을 동기(보고서 스트리밍)·비동기(검증·질문·임베딩) 경로에 나눠 합계가 상한을 넘지 않게 함
+        self._sync_concurrency = settings.gemini_max_concurrency // 2
+        self._max_concurrency = settings.gemini_max_concurrency - self._sync_concurrency
+        self._semaphore = threading.BoundedSemaphore(self._sync_concurrency)
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+        self._async_semaphore_loop = None
+        
+        # 동일 입력에 대한 API 재호출 방지용 캐시 (정확히 일치하는 입력만, 결정적인 호출만 캐시)
+        self._validation_cache = LLMCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds
+        )
+        self._report_cache = LLMCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds
+        )
+        
+        # 최근 API로 검증한 입력의 (단위 임베딩, 검증 결과), 오래된 항목부터 제거
+        self._validation_vectors: Deque[Tuple[List[float], Dict[str, Any]]] = deque(
+            maxlen=settings.validation_semantic_cache_size
         )
     
-    def validate_business_input(self, business_description: str) -> Dict[str, Any]:
+    async def awarmup(self):
+        """모델별 토큰 수 계산 호출로 gRPC 채널을 미리 연결 (생성 비용 없음, 실패해도 무시)"""
+        try:
+            await asyncio.gather(*(
+                model.count_tokens_async(
+                    "warmup",
+                    request_options={"timeout": 10.0}
+                )
+                for model in (self.validation_model, self.question_model, self.report_model)
+            ))
+        except Exception:
+            logger.warning("Gemini 연결 준비 실패 (첫 요청에서 연결)", exc_info=True)
+    
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """작업별 응답 캐시 적중/미스 통계"""
+        return {
+            "validation": self._validation_cache.get_stats(),
+            "report": self._report_cache.get_stats(),
+        }
+    
+    def _generate_stream(self, model, contents, **kwargs) -> Iterator[Any]:
         """
-        1차 입력 검증: 비즈니스 아이디어인지 확인
+        Gemini 동기 스트리밍 호출 (동시 호출 수 제한 + 일시적 오류 재시도)
+        
+        스트림을 끝까지 읽거나 제너레이터가 닫힐 때까지 동시 호출 슬롯을 점유
+        """
+        with self._semaphore:
+            yield from model.generate_content(
+                contents,
+                stream=True,
+                request_options=self._request_options,
+                **kwargs
+            )
+    
+    def _get_async_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 동시 호출 제한 세마포어 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._async_semaphore_loop is not loop:
+            self._async_semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._async_semaphore_loop = loop
+        return self._async_semaphore
+    
+    async def _agenerate(self, model, contents, **kwargs):
+        """Gemini 비동기 호출 (동시 호출 수 제한 + 일시적 오류 재시도)"""
+        async with self._get_async_semaphore():
+            return await model.generate_content_async(
+                contents,
+                request_options=self._async_request_options,
+                **kwargs
+            )
+    
+    async def avalidate_business_input(self, business_description: str) -> Dict[str, Any]:
+        """
+        1차 입력 검증: 비즈니스 아이디어인지 확인 (질문 생성과 동시에 실행)
         
         Args:
             business_description: 사용자가 입력한 사업 설명
@@ -44,99 +846,210 @@ class GPTService:
         Returns:
             Dict: {"is_valid": bool, "message": str, "suggestion": str}
         """
-        prompt = f"""
-당신은 비즈니스 아이디어 검증 전문가입니다.
-
-사용자 입력: "{business_description}"
-
-위 입력이 비즈니스 아이디어나 사업 계획과 관련된 내용인지 판단해주세요.
-
-**판단 기준:**
-- 비즈니스/사업 관련 내용: 제품, 서비스, 창업, 사업 모델, 고객, 시장 등의 키워드 포함
-- 관련 없는 내용: 일상 대화, 날씨, 음식, 일반적인 질문 등
-
-**출력 형식 (정확히 이 형식으로만 답변):**
-VALID: [YES 또는 NO]
-MESSAGE: [사용자에게 보여줄 메시지]
-SUGGESTION: [YES인 경우 비워두고, NO인 경우 올바른 입력 예시 제공]
-
-예시 1:
-VALID: YES
-MESSAGE: 비즈니스 아이디어가 확인되었습니다.
-SUGGESTION: 
-
-예시 2:
-VALID: NO
-MESSAGE: 비즈니스 아이디어를 구체적으로 입력해주세요.
-SUGGESTION: 예: '온라인 중고 도서 거래 플랫폼 서비스', 'AI 기반 맞춤형 학습 관리 시스템', '친환경 배달 용기 렌탈 사업'
-"""
+        cache_key = LLMCache.cache_key(
+            self.models["validate"],
+            business_description.strip().lower(),
+            _VALIDATION_CONFIG["temperature"]
+        )
+        # 캐시 적중·로컬 판단은 임베딩 호출 없이 바로 반환
+        result = self._get_local_validation(business_description, cache_key)
+        if result is not None:
+            return result
         
-        try:
-            full_prompt = f"""당신은 비즈니스 아이디어를 정확하게 검증하는 전문가입니다. 주어진 형식을 엄격히 따라 답변해주세요.
-
-{prompt}"""
-            
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config={
-                    'temperature': 0.3,
-                    'max_output_tokens': 500,
-                },
-                safety_settings=self.safety_settings
-            )
-            
-            # 안전 필터로 차단된 경우 처리
-            if not response.candidates or not response.candidates[0].content.parts:
-                print(f"입력 검증 응답이 차단됨: finish_reason={response.candidates[0].finish_reason if response.candidates else 'N/A'}")
-                raise Exception("Response blocked by safety filters")
-            
-            result_text = response.text.strip()
-            
-            # 응답 파싱
-            is_valid = False
-            message = "입력을 다시 확인해주세요."
-            suggestion = ""
-            
-            for line in result_text.split('\n'):
-                line = line.strip()
-                if line.startswith('VALID:'):
-                    is_valid = 'YES' in line.upper()
-                elif line.startswith('MESSAGE:'):
-                    message = line.replace('MESSAGE:', '').strip()
-                elif line.startswith('SUGGESTION:'):
-                    suggestion = line.replace('SUGGESTION:', '').strip()
+        # 임베딩(유사 입력 조회)과 검증 호출을 동시에 시작하여 먼저 끝난 쪽으로 결정
+        generate_task = asyncio.create_task(self._agenerate(
+            self.validation_model,
+            self._create_validation_prompt(business_description)
+        ))
+        vector = None
+        if settings.validation_semantic_threshold < 1.0:
+            embed_task = asyncio.create_task(self._aembed_validation_input(business_description))
+            try:
+                await asyncio.wait({embed_task, generate_task}, return_when=asyncio.FIRST_COMPLETED)
+            except BaseException:
+                embed_task.cancel()
+                generate_task.cancel()
+                raise
             
-            return {
-                "is_valid": is_valid,
-                "message": message,
-                "suggestion": suggestion
-            }
+            if not embed_task.done():
+                # 검증 응답이 먼저 도착하면 임베딩은 취소 (이 입력은 유사 조회 대상에 추가하지 않음)
+                embed_task.cancel()
+            else:
+                vector = embed_task.result()
+                if vector is not None:
+                    result = await self._alookup_similar_validation(vector, cache_key)
+                    if result is not None:
+                        generate_task.cancel()
+                        return result
+        
+        try:
+            response = await generate_task
+            result = self._validation_from_response(response, cache_key)
+            if vector is not None:
+                self._validation_vectors.append((vector, result))
+            return result
             
         except Exception as e:
-            print(f"GPT API 오류 (입력 검증): {e}")
-            # 폴백: 간단한 키워드 검증
-            business_keywords = [
-                "사업", "창업", "서비스", "제품", "플랫폼", "앱", "웹사이트",
-                "고객", "시장", "판매", "유통", "제조", "개발", "솔루션",
-                "비즈니스", "스타트업", "기업", "회사", "매출", "수익"
-            ]
-            
-            has_business_keyword = any(keyword in business_description for keyword in business_keywords)
-            
-            if has_business_keyword or len(business_description) > 20:
-                return {
+            logger.exception("GPT API 오류 (입력 검증)")
+            return self._get_fallback_validation(business_description)
+    
+    async def _aembed_validation_input(self, business_description: str) -> Optional[List[float]]:
+        """입력 검증 대상 문장의 단위 임베딩 벡터 (실패 시 None)"""
+        try:
+            async with self._get_async_semaphore():
+                embedding = (await genai.embed_content_async(
+                    model=settings.gemini_embedding_model,
+                    content=business_description,
+                    task_type="semantic_similarity",
+                    request_options=self._async_request_options
+                ))["embedding"]
+        except Exception:
+            logger.exception("입력 임베딩 오류 (유사 검증 결과 조회 생략)")
+            return None
+        
+        return _unit_vector(embedding)
+    
+    async def _alookup_similar_validation(
+        self,
+        vector: List[float],
+        cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """의미가 거의 같은 이전 입력의 검증 결과 (유사도 계산은 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        if not self._validation_vectors:
+            return None
+        # 스레드에서 순회하는 동안 목록이 바뀌지 않도록 현재 항목을 복사해서 전달
+        return await asyncio.to_thread(
+            self._find_similar_validation,
+            vector,
+            tuple(self._validation_vectors),
+            cache_key
+        )
+    
+    def _find_similar_validation(
+        self,
+        vector: List[float],
+        candidates: Tuple[Tuple[List[float], Dict[str, Any]], ...],
+        cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """코사인 유사도가 임계값을 넘는 이전 입력의 검증 결과 (없으면 None)"""
+        best_score = settings.validation_semantic_threshold
+        best_result = None
+        for cached_vector, cached_result in candidates:
+            score = sum(map(mul, vector, cached_vector))
+            if score > best_score:
+                best_score = score
+                best_result = cached_result
+        
+        if best_result is not None:
+            logger.debug("유사 입력의 검증 결과 재사용: 유사도 %.3f", best_score)
+            self._validation_cache.set(cache_key, best_result)
+        return best_result
+    
+    def _get_local_validation(
+        self,
+        business_description: str,
+        cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """API 호출 없이 판단 가능한 검증 결과 (캐시 / 명백한 사업 설명), 없으면 None"""
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 업종 키워드가 2개 이상 매칭되는 명백한 사업 설명은 API 호출 없이 통과
+        if settings.validation_local_shortcut:
+            top_category = classify_business(business_description)[0]
+            if (top_category.category_id != IndustryCategory.GENERAL_BUSINESS
+                    and top_category.confidence_score >= 30):
+                result = {
                     "is_valid": True,
                     "message": "비즈니스 아이디어가 확인되었습니다.",
                     "suggestion": ""
                 }
-            else:
-                return {
-                    "is_valid": False,
-                    "message": "비즈니스 아이디어를 구체적으로 입력해주세요. 예: '온라인 중고 도서 거래 플랫폼', 'AI 기반 학습 관리 시스템'",
-                    "suggestion": "사업 아이템, 목표 고객, 제공할 가치를 포함하여 설명해주세요."
+                self._validation_cache.set(cache_key, result)
+                return result
+            
+            # 비즈니스 키워드가 충분한 긴 설명은 통과 (짧거나 키워드가 없는 애매한 입력은 API로 검증)
+            keyword_count = _count_business_keywords(business_description)
+            length = len(business_description.strip())
+            if keyword_count >= _LOCAL_VALID_MIN_KEYWORDS and length >= _LOCAL_VALID_MIN_LENGTH:
+                logger.debug("입력 검증 로컬 통과: 키워드 %d개, %d자", keyword_count, length)
+                result = {
+                    "is_valid": True,
+                    "message": "비즈니스 아이디어가 확인되었습니다.",
+                    "suggestion": ""
                 }
+                self._validation_cache.set(cache_key, result)
+                return result
+        
+        return None
+    
+    def _create_validation_prompt(self, business_description: str) -> str:
+        """입력 검증 프롬프트 (판단 기준·출력 형식은 _VALIDATION_SYSTEM_INSTRUCTION에 있음)"""
+        return f"""사용자 입력: "{business_description}"
+
+위 입력이 비즈니스 아이디어나 사업 계획과 관련된 내용인지 판단해주세요."""
+    
+    def _validation_from_response(self, response, cache_key: str) -> Dict[str, Any]:
+        """입력 검증 응답을 결과로 변환하고 캐시에 저장 (차단된 응답은 예외)"""
+        # 안전 필터로 차단된 경우 처리
+        if not response.candidates or not response.candidates[0].content.parts:
+            logger.warning(
+                "입력 검증 응답이 차단됨: finish_reason=%s",
+                response.candidates[0].finish_reason if response.candidates else 'N/A'
+            )
+            raise Exception("Response blocked by safety filters")
+        
+        result = self._parse_validation_response(response.text.strip())
+        self._validation_cache.set(cache_key, result)
+        return result
+    
+    def _get_fallback_validation(self, business_description: str) -> Dict[str, Any]:
+        """GPT API 실패 시 사용할 간단한 키워드 검증"""
+        if _has_business_keyword(business_description) or len(business_description) > 20:
+            return {
+                "is_valid": True,
+                "message": "비즈니스 아이디어가 확인되었습니다.",
+                "suggestion": ""
+            }
+        else:
+            return {
+                "is_valid": False,
+                "message": "비즈니스 아이디어를 구체적으로 입력해주세요. 예: '온라인 중고 도서 거래 플랫폼', 'AI 기반 학습 관리 시스템'",
+                "suggestion": "사업 아이템, 목표 고객, 제공할 가치를 포함하여 설명해주세요."
+            }
     
-    def generate_questions(
+    def _parse_validation_response(self, result_text: str) -> Dict[str, Any]:
+        """입력 검증 JSON 응답 파싱 (JSON이 아니면 VALID/MESSAGE/SUGGESTION 줄 형식으로 파싱)"""
+        is_valid = False
+        message = "입력을 다시 확인해주세요."
+        suggestion = ""
+        
+        try:
+            payload = _json_loads(result_text)
+        except ValueError:
+            payload = None
+        
+        if isinstance(payload, dict):
+            is_valid = payload.get("is_valid") is True
+            message = payload.get("message") or message
+            suggestion = payload.get("suggestion") or ""
+        else:
+            for match in _VALIDATION_LINE_RE.finditer(result_text):
+                label, value = match.group(1, 2)
+                if label == 'VALID':
+                    is_valid = 'YES' in value.upper()
+                elif label == 'MESSAGE':
+                    message = value
+                else:
+                    suggestion = value
+        
+        return {
+            "is_valid": is_valid,
+            "message": message,
+            "suggestion": suggestion
+        }
+    
+    async def agenerate_questions(
         self,
         business_name: str,
         business_description: str,
@@ -144,7 +1057,7 @@ SUGGESTION: 예: '온라인 중고 도서 거래 플랫폼 서비스', 'AI 기
         methods: List[AnalysisMethod]
     ) -> List[Question]:
         """
-        선택된 분석 기법에 따라 맞춤형 질문 생성
+        선택된 분석 기법에 따라 맞춤형 질문 생성 (기법별 호출을 동시에 실행)
         
         Args:
             business_name: 사업명
@@ -155,99 +1068,259 @@ SUGGESTION: 예: '온라인 중고 도서 거래 플랫폼 서비스', 'AI 기
         Returns:
             List[Question]: 생성된 질문 목록 (총 5개)
         """
-        questions = []
-        
-        # 각 분석 기법별로 2~3개씩 질문 생성 (총 5개)
-        for i, method in enumerate(methods):
-            method_description = METHOD_DESCRIPTIONS.get(method, "")
+        # 모든 기법의 질문을 한 번의 호출로 생성 (분할 실패 시 기법별 호출로 폴백)
+        try:
+            prompt = self._create_combined_question_prompt(business_description, methods)
             
-            prompt = self._create_question_generation_prompt(
-                business_description,
-                method,
-                method_description
-            )
+            response = await self._agenerate(self.question_model, prompt)
             
-            try:
-                full_prompt = f"""당신은 비즈니스 리스크 분석 전문가입니다. 사업의 리스크를 파악하기 위한 핵심 질문들을 생성해주세요.
-
-{prompt}"""
-                
-                response = self.model.generate_content(
-                    full_prompt,
-                    generation_config={
-                        'temperature': 0.7,
-                        'max_output_tokens': 2000,
-                    },
-                    safety_settings=self.safety_settings
+            # 안전 필터로 차단된 경우 처리
+            if not response.candidates or not response.candidates[0].content.parts:
+                logger.warning(
+                    "응답이 안전 필터에 차단됨: finish_reason=%s",
+                    response.candidates[0].finish_reason if response.candidates else 'N/A'
                 )
+                raise Exception("Response blocked by safety filters")
+            
+            parsed = self._parse_question_sections(response.text, methods)
+            if len(parsed) >= len(methods):
+                sections = []
+                for i, (method, method_questions) in enumerate(zip(methods, parsed)):
+                    if not method_questions:
+                        method_questions = self._get_fallback_questions(method, f"method{i+1}")
+                    # 각 기법당 최대 3개로 제한
+                    sections.append(method_questions[:3])
+            else:
+                sections = None
+                logger.warning("통합 질문 응답 분할 실패: %d/%d개 섹션", len(parsed), len(methods))
+            
+        except Exception as e:
+            sections = None
+            logger.exception("GPT API 오류 (통합 질문 생성)")
+        
+        if sections is None:
+            sections = await self._agenerate_questions_per_method(business_description, methods)
+        
+        # 기법 간 중복 질문 제거
+        if len(sections) > 1 and settings.question_dedup_threshold < 1.0:
+            sections = await self._adedupe_question_sections(sections)
+        
+        # 최종적으로 총 5개로 제한
+        questions = [question for section in sections for question in section]
+        return questions[:5]
+    
+    async def _agenerate_questions_per_method(
+        self,
+        business_description: str,
+        methods: List[AnalysisMethod]
+    ) -> List[List[Question]]:
+        """기법별 질문 생성 호출을 동시에 실행 (통합 호출 실패 시 폴백, 기법별 질문 목록 반환)"""
+        # 프롬프트는 기법과 무관하므로 한 번만 만들고 기법 수만큼 호출을 동시에 전송
+        prompt = self._create_question_generation_prompt(business_description)
+        requests = [
+            self._agenerate(
+                self.question_model,
+                prompt,
+                generation_config=_QUESTION_LIST_CONFIG
+            )
+            for _ in methods
+        ]
+        
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+        
+        sections = []
+        
+        # 각 분석 기법별로 2~3개씩 질문 생성
+        for i, (method, response) in enumerate(zip(methods, responses)):
+            try:
+                if isinstance(response, Exception):
+                    raise response
                 
                 # 안전 필터로 차단된 경우 처리
                 if not response.candidates or not response.candidates[0].content.parts:
-                    print(f"응답이 안전 필터에 차단됨: finish_reason={response.candidates[0].finish_reason if response.candidates else 'N/A'}")
+                    logger.warning(
+                        "응답이 안전 필터에 차단됨: finish_reason=%s",
+                        response.candidates[0].finish_reason if response.candidates else 'N/A'
+                    )
                     raise Exception("Response blocked by safety filters")
                 
-                # Gemini 응답 파싱
-                generated_text = response.text
-                method_questions = self._parse_questions_from_gpt_response(
-                    generated_text, 
-                    method, 
+                # Gemini JSON 응답 파싱
+                method_questions = self._parse_question_list(
+                    response.text,
+                    method,
                     f"method{i+1}"
                 )
                 # 각 기법당 최대 3개로 제한
-                method_questions = method_questions[:3]
-                questions.extend(method_questions)
+                sections.append(method_questions[:3])
                 
             except Exception as e:
-                print(f"GPT API 오류: {e}")
+                logger.error("GPT API 오류 (%s 질문 생성): %s", method.value, e)
                 # 폴백: 기본 질문 사용
                 fallback_questions = self._get_fallback_questions(method, f"method{i+1}")
-                questions.extend(fallback_questions[:3])  # 폴백도 최대 3개
+                sections.append(fallback_questions[:3])  # 폴백도 최대 3개
+        
+        return sections
+    
+    async def _adedupe_question_sections(
+        self,
+        sections: List[List[Question]]
+    ) -> List[List[Question]]:
+        """
+        다른 분석 기법의 질문과 의미가 거의 같은 질문 제거 (임베딩 코사인 유사도)
+        
+        Args:
+            sections: 기법 순서대로 나열한 기법별 질문 목록
+            
+        Returns:
+            List[List[Question]]: 중복 제거 후 기법별로 ID를 다시 매긴 질문 목록 (임베딩 실패 시 원본)
+        """
+        texts = [question.question_text for section in sections for question in section]
+        if len(texts) < 2:
+            return sections
+        
+        # 모든 질문을 한 번의 배치 호출로 임베딩
+        try:
+            async with self._get_async_semaphore():
+                result = await genai.embed_content_async(
+                    model=settings.gemini_embedding_model,
+                    content=texts,
+                    task_type="semantic_similarity",
+                    request_options=self._async_request_options
+                )
+            embeddings = result["embedding"]
+        except Exception:
+            logger.exception("질문 임베딩 오류 (중복 제거 생략)")
+            return sections
+        
+        # 단위 벡터로 정규화 (내적 = 코사인 유사도)
+        vectors = [_unit_vector(embedding) for embedding in embeddings]
+        
+        # 앞선 기법에서 남긴 질문과 유사도가 임계값을 넘으면 제외
+        threshold = settings.question_dedup_threshold
+        kept: List[Tuple[int, List[float]]] = []
+        deduped = []
+        position = 0
+        for section_index, section in enumerate(sections):
+            unique = []
+            for question in section:
+                vector = vectors[position]
+                position += 1
+                if any(
+                    kept_index != section_index
+                    and sum(a * b for a, b in zip(vector, kept_vector)) > threshold
+                    for kept_index, kept_vector in kept
+                ):
+                    continue
+                kept.append((section_index, vector))
+                unique.append(question)
+            
+            # 남은 질문의 ID를 기법별로 다시 매김 (Question은 frozen이므로 복사본 생성)
+            deduped.append([
+                question.model_copy(update={"question_id": f"method{section_index+1}_q{i}"})
+                for i, question in enumerate(unique, 1)
+            ])
+        
+        return deduped
+    
+    def _create_question_generation_prompt(self, business_description: str) -> str:
+        """질문 생성을 위한 프롬프트 작성"""
+        return _build_question_prompt(business_description)
+    
+    def _create_combined_question_prompt(
+        self,
+        business_description: str,
+        methods: List[AnalysisMethod]
+    ) -> str:
+        """모든 분석 기법의 질문을 한 번에 생성하기 위한 프롬프트 작성"""
+        return _build_combined_question_prompt(business_description, tuple(methods))
+    
+    def _parse_question_sections(
+        self,
+        response_text: str,
+        methods: List[AnalysisMethod]
+    ) -> List[List[Question]]:
+        """통합 질문 JSON 응답을 기법별 질문 목록으로 변환 (순서대로, 누락 시 개수 부족)"""
+        try:
+            payload = _json_loads(response_text)
+        except ValueError:
+            # JSON이 아니면 METHOD 구분선 텍스트 형식으로 분할
+            segments = self._split_method_sections(response_text, len(methods))
+            return [
+                self._parse_questions_from_gpt_response(segment, method, f"method{i+1}")
+                for i, (method, segment) in enumerate(zip(methods, segments))
+            ]
+        
+        sections: Dict[int, List[Question]] = {}
+        raw_sections = payload.get("sections") if isinstance(payload, dict) else None
+        for section in raw_sections or []:
+            if not isinstance(section, dict) or not isinstance(section.get("method_number"), int):
+                continue
+            index = section["method_number"] - 1
+            if 0 <= index < len(methods) and index not in sections:
+                sections[index] = self._questions_from_specs(
+                    section.get("questions"),
+                    methods[index],
+                    f"method{index+1}"
+                )
+        
+        return [sections[i] for i in range(len(methods)) if i in sections]
+    
+    def _parse_question_list(
+        self,
+        response_text: str,
+        method: AnalysisMethod,
+        method_prefix: str
+    ) -> List[Question]:
+        """기법별 질문 JSON 응답 파싱 (JSON이 아니면 Q1: 텍스트 형식으로 파싱)"""
+        try:
+            payload = _json_loads(response_text)
+        except ValueError:
+            return self._parse_questions_from_gpt_response(response_text, method, method_prefix)
+        
+        specs = payload.get("questions") if isinstance(payload, dict) else payload
+        return self._questions_from_specs(specs, method, method_prefix)
+    
+    def _questions_from_specs(
+        self,
+        specs: Any,
+        method: AnalysisMethod,
+        method_prefix: str
+    ) -> List[Question]:
+        """JSON 질문 항목 목록을 Question 목록으로 변환 (형식이 맞지 않는 항목은 건너뜀)"""
+        questions = []
+        for spec in specs if isinstance(specs, list) else []:
+            if not isinstance(spec, dict) or not spec.get("question_text"):
+                continue
+            
+            question_type = spec.get("question_type")
+            if question_type not in _QUESTION_TYPES:
+                question_type = "text"
+            
+            choices = spec.get("choices")
+            if not isinstance(choices, list) or not choices:
+                choices = None
+            
+            questions.append(Question(
+                question_id=f"{method_prefix}_q{len(questions) + 1}",
+                method=method,
+                question_text=str(spec["question_text"]).strip(),
+                question_type=question_type,
+                choices=[str(choice).strip() for choice in choices] if choices else None
+            ))
         
-        # 최종적으로 총 5개로 제한
-        return questions[:5]
+        return questions
     
-    def _create_question_generation_prompt(
-        self,
-        business_description: str,
-        method: AnalysisMethod,
-        method_description: str
-    ) -> str:
-        """질문 생성을 위한 프롬프트 작성"""
-        
-        # 업종별 맞춤 가이드
-        industry_context = self._get_industry_specific_context(business_description, method)
+    def _split_method_sections(self, response_text: str, n_methods: int) -> List[str]:
+        """통합 질문 응답을 METHOD 구분선 기준으로 기법별 구간으로 분할 (순서대로, 누락 시 개수 부족)"""
+        sections: Dict[int, str] = {}
+        matches = list(_METHOD_SECTION_RE.finditer(response_text))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            index = int(match.group(1)) - 1
+            end = next_match.start() if next_match is not None else len(response_text)
+            if 0 <= index < n_methods and index not in sections:
+                sections[index] = response_text[match.end():end]
         
-        return f"""
-당신은 창업 컨설턴트입니다.
-
-아래 사업을 분석 중입니다:
-"{business_description}"
-
-{industry_context}
-
-**중요 규칙:**
-1. 위 사업 내용을 반드시 질문에 직접 언급하세요
-   예시: "교육 앱" 사업이라면 → "앱에서 제공할 강의는 누가 만드나요?"
-   예시: "카페" 사업이라면 → "카페 위치는 어디이며, 하루 예상 손님 수는 몇 명인가요?"
-
-2. 일반적인 질문 절대 금지:
-   ❌ "사업의 핵심 목표는 무엇인가요?"
-   ❌ "주요 고객층은 누구인가요?"
-   ❌ "예상되는 주요 리스크는 무엇인가요?"
-   ❌ "해결하려는 핵심 문제는 무엇인가요?"
-   이런 질문들은 모든 사업에 다 해당하므로 절대 사용하지 마세요!
-
-3. 정확히 2~3개의 질문만 생성하세요
-
-4. 각 질문은 "{business_description}" 사업에만 해당하는 구체적인 내용이어야 합니다
-
-**출력 형식:**
-Q1: [질문] | text |
-Q2: [질문] | number |
-Q3: [질문] | text |
-
-지금 바로 "{business_description}" 사업을 위한 구체적인 질문을 만드세요!
-"""
+        return [sections[i] for i in range(n_methods) if i in sections]
     
     def _parse_questions_from_gpt_response(
         self, 
@@ -258,141 +1331,48 @@ Q3: [질문] | text |
         """GPT 응답에서 질문 파싱"""
         
         questions = []
-        lines = response_text.strip().split('\n')
         
-        q_count = 1
-        for line in lines:
-            line = line.strip()
-            if not line or not line.startswith('Q'):
-                continue
+        # "Q1: 질문 | type | choices" 형식의 줄만 정규식으로 추출
+        for q_count, match in enumerate(_Q_LINE_RE.finditer(response_text), 1):
+            question_text, question_type, choice_str = match.group(1, 2, 3)
             
-            try:
-                # "Q1: 질문 | type | choices" 형식 파싱
-                parts = line.split('|')
-                
-                # 질문 텍스트 추출
-                question_part = parts[0].split(':', 1)
-                if len(question_part) < 2:
-                    continue
-                question_text = question_part[1].strip()
-                
-                # 답변 유형
-                question_type = parts[1].strip() if len(parts) > 1 else "text"
-                if question_type not in ["text", "number", "choice"]:
-                    question_type = "text"
-                
-                # 선택지
-                choices = None
-                if len(parts) > 2 and parts[2].strip():
-                    choices = [c.strip() for c in parts[2].split(',')]
-                
-                questions.append(Question(
-                    question_id=f"{method_prefix}_q{q_count}",
-                    method=method,
-                    question_text=question_text,
-                    question_type=question_type,
-                    choices=choices
-                ))
-                q_count += 1
-                
-            except Exception as e:
-                print(f"질문 파싱 오류: {e}, line: {line}")
-                continue
+            # 답변 유형
+            if question_type not in _QUESTION_TYPES:
+                question_type = "text"
+            
+            # 선택지
+            choices = None
+            if choice_str:
+                choices = [c.strip() for c in choice_str.split(',')]
+            
+            questions.append(Question(
+                question_id=f"{method_prefix}_q{q_count}",
+                method=method,
+                question_text=question_text,
+                question_type=question_type,
+                choices=choices
+            ))
         
         return questions
     
-    def _get_industry_specific_context(self, business_description: str, method: AnalysisMethod) -> str:
-        """업종별 특화된 질문 가이드 제공"""
-        concept_lower = business_description.lower()
-        
-        # 업종 감지
-        if any(kw in concept_lower for kw in ["앱", "소프트웨어", "플랫폼", "IT", "개발", "스타트업", "웹", "모바일"]):
-            return f"""
-이 사업은 IT/앱 분야입니다. 이런 질문을 만드세요:
-✅ "{business_description}"를 개발할 개발자가 있나요? 몇 명이며 언제 완성되나요?
-✅ "{business_description}"와 비슷한 앱/서비스가 있나요? 이름이 뭐고 뭐가 다른가요?
-✅ 첫 달에 "{business_description}"를 사용할 사람이 몇 명 정도 될까요?
-"""
-        elif any(kw in concept_lower for kw in ["교육", "학습", "강의", "학원", "에듀테크", "교육용"]):
-            return f"""
-이 사업은 교육 분야입니다. 이런 질문을 만드세요:
-✅ "{business_description}"에서 가르칠 강사/선생님이 있나요? 몇 명인가요?
-✅ "{business_description}"의 수강료는 얼마이며, 한 달에 학생이 몇 명 필요한가요?
-✅ "{business_description}"를 통해 학습하면 어떤 결과가 나오나요? (성적? 자격증?)
-"""
-        elif any(kw in concept_lower for kw in ["제조", "생산", "공장", "설비", "제품 생산", "양산"]):
-            return f"""
-이 사업은 제조 분야입니다. 이런 질문을 만드세요:
-✅ "{business_description}" 제품을 만들 설비(기계)가 있나요? 얼마인가요?
-✅ 하루에 "{business_description}" 제품을 몇 개 만들 수 있나요?
-✅ "{business_description}" 제품의 불량률은 몇 %인가요?
-"""
-        elif any(kw in concept_lower for kw in ["외식", "음식점", "카페", "레스토랑", "서비스", "매장", "가게"]):
-            return f"""
-이 사업은 서비스/외식 분야입니다. 이런 질문을 만드세요:
-✅ "{business_description}" 가게 위치는 어디이며, 하루 유동인구는 몇 명인가요?
-✅ "{business_description}"에서 판매할 제품의 원가는 판매가의 몇 %인가요?
-✅ 근처에 "{business_description}"와 비슷한 가게가 몇 개 있나요?
-"""
-        elif any(kw in concept_lower for kw in ["마케팅", "광고", "브랜드", "홍보", "프로모션"]):
-            return f"""
-이 사업은 마케팅 분야입니다. 이런 질문을 만드세요:
-✅ "{business_description}"의 타겟 고객은 정확히 누구인가요? (나이, 성별, 직업)
-✅ "{business_description}" 광고 예산은 얼마이며, 어디에 쓸 건가요?
-✅ "{business_description}" 효과를 어떻게 측정할 건가요?
-"""
-        else:
-            return f"""
-이런 질문을 만드세요:
-✅ "{business_description}"의 고객은 누구이며, 왜 우리를 선택해야 하나요?
-✅ "{business_description}"로 한 달에 얼마를 벌 수 있나요?
-✅ "{business_description}"와 경쟁하는 업체는 어디인가요?
-"""
-    
     def _get_fallback_questions(
         self, 
         method: AnalysisMethod,
         method_prefix: str
     ) -> List[Question]:
         """GPT API 실패 시 사용할 기본 질문"""
+        question_texts = _FALLBACK_QUESTION_TEXTS.get(method, _DEFAULT_FALLBACK_QUESTION_TEXTS)
         
-        # 각 분석 기법별 기본 질문
-        fallback_map = {
-            AnalysisMethod.SWOT: [
-                "우리 사업의 가장 큰 강점은 무엇인가요?",
-                "우리 사업의 주요 약점은 무엇인가요?",
-                "시장에서 어떤 기회를 포착하고 있나요?",
-                "가장 큰 위협 요소는 무엇인가요?",
-                "경쟁사 대비 우리의 차별점은 무엇인가요?"
-            ],
-            AnalysisMethod.LEAN_CANVAS: [
-                "해결하려는 고객의 핵심 문제는 무엇인가요?",
-                "목표 고객 세그먼트는 누구인가요?",
-                "제공하는 고유한 가치는 무엇인가요?",
-                "주요 수익원은 무엇인가요?",
-                "핵심 비용 구조는 어떻게 되나요?"
-            ]
-        }
-        
-        default_questions = [
-            "사업의 핵심 목표는 무엇인가요?",
-            "주요 고객층은 누구인가요?",
-            "예상되는 주요 리스크는 무엇인가요?",
-            "경쟁 환경은 어떠한가요?",
-            "성공의 핵심 요소는 무엇인가요?"
-        ]
-        
-        question_texts = fallback_map.get(method, default_questions)
-        
-        questions = []
-        for i, text in enumerate(question_texts, 1):
-            questions.append(Question(
+        questions = [
+            Question(
                 question_id=f"{method_prefix}_q{i}",
                 method=method,
                 question_text=text,
                 question_type="text",
                 choices=None
-            ))
+            )
+            for i, text in enumerate(question_texts, 1)
+        ]
         
         return questions
     
@@ -403,7 +1383,7 @@ Q3: [질문] | text |
         investment_amount: Optional[int],
         methods: List[AnalysisMethod],
         questions: List[Question],
-        answers: List[Answer],
+        answers: Union[List[Answer], Dict[str, str]],
         industry_category = None
     ) -> Dict[str, Any]:
         """
@@ -415,14 +1395,67 @@ Q3: [질문] | text |
             investment_amount: 투자금액
             methods: 사용된 분석 기법
             questions: 질문 목록
-            answers: 사용자 답변 목록
+            answers: 사용자 답변 목록 (또는 이미 만든 질문 ID → 답변 매핑)
             industry_category: 업종 카테고리
             
         Returns:
             Dict: OSD 기반 리스크 보고서 데이터
         """
-        # 질문-답변 매핑
-        qa_map = {answer.question_id: answer.answer for answer in answers}
+        # 질문-답변 매핑 (스트리밍 생성에도 그대로 전달하여 재구성 생략)
+        qa_map = _to_qa_map(answers)
+        
+        # 입력이 완전히 같으면 이전 보고서 재사용
+        cache_key = LLMCache.cache_key(
+            self.models["report"],
+            business_name,
+            business_description,
+            investment_amount,
+            tuple(METHOD_VALUE[m] for m in methods),
+            tuple((q.question_id, q.question_text) for q in questions),
+            tuple(sorted(qa_map.items()))
+        )
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본 반환
+            return copy.deepcopy(cached)
+        
+        # 스트리밍 결과를 끝까지 소비하여 최종 보고서 조립
+        for event in self.generate_risk_report_stream(
+            business_name,
+            business_description,
+            investment_amount,
+            methods,
+            questions,
+            qa_map,
+            industry_category
+        ):
+            if event["type"] == "report":
+                report = event["data"]
+                # 모든 기법을 응답에서 파싱한 보고서만 캐시 (폴백이 섞인 보고서는 다시 생성)
+                if event["complete"]:
+                    self._report_cache.set(cache_key, copy.deepcopy(report))
+        
+        return report
+    
+    def generate_risk_report_stream(
+        self,
+        business_name: str,
+        business_description: str,
+        investment_amount: Optional[int],
+        methods: List[AnalysisMethod],
+        questions: List[Question],
+        answers: Union[List[Answer], Dict[str, str]],
+        industry_category = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        OSD 기반 리스크 보고서를 스트리밍으로 생성
+        
+        분석 기법 블록이 완성될 때마다 {"type": "method_result", "data": ...}를 내보내고,
+        마지막에 {"type": "report", "data": 전체 보고서, "complete": 완전 여부}를 내보냄
+        (응답에서 파싱하지 못한 부분은 폴백 데이터로 채움, complete는 스트림이 정상 종료되고
+        모든 기법을 응답에서 파싱한 경우에만 True)
+        """
+        qa_map = _to_qa_map(answers)
         
         prompt = self._create_report_generation_prompt(
             business_name,
@@ -433,46 +1466,41 @@ Q3: [질문] | text |
             qa_map
         )
         
+        parser = _OSDStreamParser(methods)
+        complete = False
+        
         try:
-            system_instruction = """당신은 **FMEA(Failure Mode and Effects Analysis) 분야에서 20년 이상 경력을 쌓은 리스크 분석 전문가**입니다.
-
-자동차, 항공, 제조업 등 고신뢰성 산업에서 수천 건의 FMEA를 수행하며 OSD(Occurrence×Severity×Detection) 방법론의 대가가 되었습니다.
-
-또한 스타트업 생태계에서 **창업 멘토**로 활동하며, 비즈니스 리스크를 정량적으로 측정하고 
-실질적인 해결책을 제시하는 데 탁월한 능력을 발휘합니다.
-
-당신의 역할:
-1. OSD 점수를 정확하고 객관적으로 평가
-2. 경영진이 즉시 실행할 수 있는 구체적 조언 제공
-3. 리스크를 우선순위화하여 자원 배분 최적화
-4. 20년 경력자의 통찰력으로 숨겨진 리스크 발견
-
-전문가답게 신중하고 정확하게 분석해주세요."""
-
-            full_prompt = f"""{system_instruction}
-
-{prompt}"""
+            received = False
+            # 중간에 닫혀도 동시 호출 슬롯이 바로 반환되도록 스트림을 명시적으로 닫음
+            with closing(self._generate_stream(self.report_model, prompt)) as response:
+                for chunk in response:
+                    # 안전 필터로 차단된 조각은 건너뜀
+                    if not chunk.candidates or not chunk.candidates[0].content.parts:
+                        continue
+                    received = True
+                    for method_result in parser.feed(chunk.text):
+                        yield {"type": "method_result", "data": method_result}
             
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config={
-                    'temperature': 0.5,
-                    'max_output_tokens': 4000,
-                },
-                safety_settings=self.safety_settings
-            )
-            
-            # 안전 필터로 차단된 경우 처리
-            if not response.candidates or not response.candidates[0].content.parts:
-                print(f"보고서 생성 응답이 차단됨: finish_reason={response.candidates[0].finish_reason if response.candidates else 'N/A'}")
+            if not received:
+                logger.warning("보고서 생성 응답이 차단됨: 수신된 내용 없음")
                 raise Exception("Response blocked by safety filters")
-            
-            report_text = response.text
-            return self._parse_osd_report(report_text, methods)
+            complete = True
             
         except Exception as e:
-            print(f"Gemini API 오류: {e}")
-            return self._get_fallback_osd_report(methods)
+            logger.exception("Gemini API 오류 (보고서 생성)")
+        
+        for method_result in parser.close():
+            yield {"type": "method_result", "data": method_result}
+        
+        # 파싱하지 못한 기법은 폴백 결과를 이어서 전송
+        parsed_count = len(parser.method_results)
+        parsed_methods = {result["method"] for result in parser.method_results}
+        complete = complete and all(method in parsed_methods for method in methods)
+        report = self._assemble_osd_report(parser, methods)
+        for method_result in report["method_results"][parsed_count:]:
+            yield {"type": "method_result", "data": method_result}
+        
+        yield {"type": "report", "data": report, "complete": complete}
     
     def _create_report_generation_prompt(
         self,
@@ -484,241 +1512,57 @@ Q3: [질문] | text |
         qa_map: Dict[str, str]
     ) -> str:
         """리스크 보고서 생성 프롬프트"""
-        
-        # 질문-답변 포맷팅
-        qa_text = ""
-        for question in questions:
-            answer = qa_map.get(question.question_id, "답변 없음")
-            qa_text += f"\n[{question.method.value}] Q: {question.question_text}\nA: {answer}\n"
-        
-        investment_info = f"{investment_amount:,}원" if investment_amount else "미정"
-        
-        # 업종별 OSD 매핑 가이드
-        method_osd_guide = {
-            "IT/스타트업 + Lean Canvas": "문제적합성→O, 경쟁대비차별성→S, 고객피드백루프→D",
-            "교육 + Logic Model": "Input부족→O, Outcome부진→S, Output측정시스템부재→D",
-            "서비스업 + Blueprint": "Frontstage혼잡→O, 고객클레임위험→S, Backstage대응력→D",
-            "제조 + FMEA": "FMEA 자체가 O/S/D 생성",
-            "기본": "발생가능성→O, 심각도→S, 발견가능성→D"
-        }
-        
-        return f"""
-다음 사업에 대한 OSD 기반 종합 리스크 분석 보고서를 작성해주세요.
-
-**사업 정보:**
-- 사업명: {business_name}
-- 사업 내용: {business_description}
-- 투자금액: {investment_info}
-
-**사용된 분석 기법:**
-{', '.join([m.value for m in methods])}
-
-**질문과 답변:**
-{qa_text}
-
-**OSD 방법론 설명:**
-- O (Occurrence): 발생 가능성 (1~10, 높을수록 발생하기 쉬움)
-- S (Severity): 심각도 (1~10, 높을수록 피해가 큼)
-- D (Detection): 발견 가능성 (1~10, 낮을수록 발견하기 어려움)
-- Risk Score = O × S × D (1~1000)
-
-**보고서 작성 요구사항:**
-
-1. **각 분석 기법별 OSD 리스크 분석**
-   각 기법마다 3~5개의 주요 리스크를 다음 형식으로 작성:
-   
-   기법: {methods[0].value}
-   리스크1: [리스크 설명] | O=[1-10] | S=[1-10] | D=[1-10] | Score=[O×S×D]
-   리스크2: [리스크 설명] | O=[1-10] | S=[1-10] | D=[1-10] | Score=[O×S×D]
-   ...
-   주요발견: [핵심 인사이트]
-   
-   기법: {methods[1].value}
-   (동일 형식)
-
-2. **AI 조언 (우선순위별)**
-   각 조언을 다음 형식으로:
-   
-   조언1: [카테고리] | [우선순위: 높음/중간/낮음] | [액션] | [예상효과] | [난이도: 쉬움/보통/어려움]
-   조언2: ...
-   (5~7개 조언)
-
-3. **경영진 요약**
-   - 사업의 핵심 리스크와 기회를 2~3문단으로 요약
-
-위 형식을 정확히 따라 숫자와 함께 작성해주세요.
-"""
+        return _build_report_prompt(
+            business_name,
+            business_description,
+            investment_amount,
+            tuple(methods),
+            _to_qa_pairs(questions, qa_map)
+        )
     
-    def _create_osd_report_prompt(
+    def _assemble_osd_report(
         self,
-        business_name: str,
-        business_description: str,
-        investment_amount: Optional[int],
-        methods: List[AnalysisMethod],
-        questions: List[Question],
-        qa_map: Dict[str, str]
-    ) -> str:
-        """OSD 기반 리스크 보고서 생성 프롬프트"""
-        
-        # 질문-답변 포맷팅
-        qa_text = ""
-        for question in questions:
-            answer = qa_map.get(question.question_id, "답변 없음")
-            qa_text += f"\n[{question.method.value}] Q: {question.question_text}\nA: {answer}\n"
-        
-        investment_info = f"{investment_amount:,}원" if investment_amount else "미정"
-        
-        return f"""
-다음 사업에 대한 OSD 기반 종합 리스크 분석 보고서를 작성해주세요.
-
-**사업 정보:**
-- 사업명: {business_name}
-- 사업 내용: {business_description}
-- 투자금액: {investment_info}
-
-**사용된 분석 기법:**
-{', '.join([m.value for m in methods])}
-
-**질문과 답변:**
-{qa_text}
-
-**OSD 방법론:**
-- O (Occurrence): 발생 가능성 (1~10)
-- S (Severity): 심각도 (1~10)
-- D (Detection): 발견 가능성 (1~10, 낮을수록 발견 어려움)
-- Risk Score = O × S × D
-
-**출력 형식:**
-
-### 분석 기법별 OSD 리스크
-
-기법: {methods[0].value}
-리스크1: [설명] | O=7 | S=8 | D=6 | Score=336
-리스크2: [설명] | O=5 | S=9 | D=7 | Score=315
-...
-인사이트: [분석 기법별 핵심 인사이트]
-
-기법: {methods[1].value}
-리스크1: ...
-
-### AI 조언
-
-조언1: 카테고리명 | 높음 | 구체적 액션 | 예상 효과 | 보통
-조언2: ...
-
-### 경영진 요약
-[2~3문단 요약]
-
-정확히 위 형식으로 작성해주세요.
-"""
-    
-    def _parse_osd_report(
-        self, 
-        report_text: str,
+        parser: "_OSDStreamParser",
         methods: List[AnalysisMethod]
     ) -> Dict[str, Any]:
-        """GPT 응답에서 OSD 기반 리스크 보고서 파싱"""
+        """파싱 결과로 보고서 조립 (파싱하지 못한 기법 / 조언 / 요약은 폴백으로 보완)"""
         
-        # 실제로는 GPT 응답을 정교하게 파싱
-        # 여기서는 폴백 데이터 반환
-        return self._get_fallback_osd_report(methods)
-    
-    def _get_fallback_osd_report(
-        self, 
-        methods: List[AnalysisMethod]
-    ) -> Dict[str, Any]:
-        """OSD 기반 폴백 리스크 보고서"""
+        # 필요한 부분만 폴백 데이터로 생성
+        parsed_methods = {result["method"] for result in parser.method_results}
+        method_results = parser.method_results + [
+            self._get_fallback_method_result(method)
+            for method in methods if method not in parsed_methods
+        ]
+        summary = "\n".join(parser.summary_lines).strip()
         
-        method_results = []
+        return {
+            "method_results": method_results,
+            "ai_recommendations": parser.recommendations or [
+                dict(rec) for rec in _FALLBACK_AI_RECOMMENDATIONS
+            ],
+            "executive_summary": summary or _FALLBACK_EXECUTIVE_SUMMARY
+        }
+    
+    def _get_fallback_method_result(self, method: AnalysisMethod) -> Dict[str, Any]:
+        """분석 기법 1개의 OSD 기반 폴백 결과"""
+        method_name = METHOD_VALUE[method]
         
-        for method in methods:
+        return {
+            "method": method,
             # 각 기법별 샘플 OSD 리스크
-            osd_risks = [
+            "osd_risks": [
                 {
-                    "occurrence": 7,
-                    "severity": 8,
-                    "detection": 6,
-                    "risk_score": 336,
-                    "description": f"{method.value} 분석 결과 - 시장 경쟁 리스크"
-                },
-                {
-                    "occurrence": 5,
-                    "severity": 9,
-                    "detection": 7,
-                    "risk_score": 315,
-                    "description": f"{method.value} 분석 결과 - 운영 리스크"
-                },
-                {
-                    "occurrence": 6,
-                    "severity": 6,
-                    "detection": 5,
-                    "risk_score": 180,
-                    "description": f"{method.value} 분석 결과 - 재무 리스크"
+                    "occurrence": occurrence,
+                    "severity": severity,
+                    "detection": detection,
+                    "risk_score": occurrence * severity * detection,
+                    "description": f"{method_name} 분석 결과 - {risk_type}"
                 }
-            ]
-            
-            method_results.append({
-                "method": method,
-                "osd_risks": osd_risks,
-                "key_findings": [
-                    f"{method.value} 기법을 통해 핵심 리스크 영역을 식별했습니다",
-                    "개선이 필요한 영역이 명확히 파악되었습니다",
-                    "단계적 리스크 완화 전략이 필요합니다"
-                ],
-                "method_specific_insights": f"{method.value} 분석을 통해 사업의 구조적 리스크를 파악할 수 있었습니다."
-            })
-        
-        # AI 조언
-        ai_recommendations = [
-            {
-                "category": "시장 검증",
-                "priority": "높음",
-                "action": "초기 고객 인터뷰를 통한 문제-해결책 적합도 재검증",
-                "expected_impact": "제품-시장 적합성 향상 및 피벗 리스크 감소",
-                "implementation_difficulty": "쉬움"
-            },
-            {
-                "category": "MVP 개발",
-                "priority": "높음",
-                "action": "핵심 기능만 포함한 최소 기능 제품(MVP) 우선 출시",
-                "expected_impact": "개발 비용 절감 및 빠른 시장 피드백",
-                "implementation_difficulty": "보통"
-            },
-            {
-                "category": "재무 관리",
-                "priority": "중간",
-                "action": "월별 번다운(Burn Rate) 모니터링 시스템 구축",
-                "expected_impact": "자금 소진 리스크 조기 감지",
-                "implementation_difficulty": "쉬움"
-            },
-            {
-                "category": "팀 역량",
-                "priority": "중간",
-                "action": "핵심 기술 스택에 대한 팀 교육 및 역량 강화",
-                "expected_impact": "개발 속도 향상 및 기술 부채 감소",
-                "implementation_difficulty": "보통"
-            },
-            {
-                "category": "고객 피드백",
-                "priority": "높음",
-                "action": "사용자 피드백 수집 자동화 시스템 도입",
-                "expected_impact": "제품 개선 속도 향상 및 이탈 방지",
-                "implementation_difficulty": "쉬움"
-            }
-        ]
-        
-        executive_summary = """
-이 사업은 중간 수준의 리스크를 보이고 있으며, 체계적인 준비를 통해 충분히 관리 가능합니다.
-
-주요 리스크는 시장 경쟁 강도와 초기 고객 확보에 집중되어 있으나, 적절한 MVP 전략과
-고객 피드백 루프를 구축한다면 성공 확률을 크게 높일 수 있습니다.
-
-투자금액 대비 리스크를 고려할 때, 단계적 투자 집행과 주요 마일스톤 달성 시점에서의
-재평가가 권장됩니다.
-"""
-        
-        return {
-            "method_results": method_results,
-            "ai_recommendations": ai_recommendations,
-            "executive_summary": executive_summary.strip()
+                for occurrence, severity, detection, risk_type in _FALLBACK_RISK_TEMPLATES
+            ],
+            "key_findings": [
+                f"{method_name} 기법을 통해 핵심 리스크 영역을 식별했습니다",
+                *_FALLBACK_KEY_FINDINGS_TAIL
+            ],
+            "method_specific_insights": f"{method_name} 분석을 통해 사업의 구조적 리스크를 파악할 수 있었습니다."
         }
@@ -0,0 +1,62 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class LLMCache:
+    """LLM 응답 캐시 (입력 해시 키, LRU + TTL, 프로세스 내 메모리)"""
+    
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 7 * 24 * 3600):
+        """
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+            ttl_seconds: 항목 유효 시간(초), 0 이하이면 만료 없음
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+    
+    @staticmethod
+    def cache_key(model: str, *parts: Any) -> str:
+        """캐시 키 생성 (모델명과 입력값을 정렬된 JSON으로 직렬화한 SHA-256 해시)"""
+        payload = json.dumps(
+            [model, parts],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return value
+                del self._entries[key]
+            
+            self.stats["misses"] += 1
+            return None
+    
+    def set(self, key: str, value: Any):
+        """캐시 저장 (최대 크기 유지)"""
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """적중/미스 횟수와 현재 항목 수"""
+        with self._lock:
+            return {**self.stats, "size": len(self._entries)}
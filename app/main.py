@@ -1,5 +1,14 @@
-from fastapi import FastAPI, HTTPException
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import ValidationError
 from datetime import datetime
 from .models import (
     InitialBusinessInput,
@@ -10,16 +19,93 @@ from .models import (
     FinalRiskReport,
     HealthResponse
 )
-from .service import RiskAnalysisService, SessionStore
+from .service import RiskAnalysisService, SessionStore, create_session_store
 from .gpt_service import GPTService
-from .config import settings
+from .config import get_settings
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# 설정
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def configure_logging(level: str) -> logging.handlers.QueueListener:
+    """
+    루트 로거를 큐 핸들러로 구성 (요청 처리 경로는 큐에 넣기만 하고 출력은 리스너 스레드가 담당)
+    
+    Returns:
+        QueueListener: 시작/종료를 호출자가 관리하는 로그 리스너
+    """
+    log_queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)s %(name)s: %(message)s"
+    ))
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level.upper())
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    return logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작 시 로그 리스너 시작·서비스 초기화·Gemini 연결 준비, 종료 시 남은 로그 출력 후 정리"""
+    listener = configure_logging(settings.log_level)
+    listener.start()
+    session_store = None
+    try:
+        # 서비스 초기화 (API 키가 없으면 import가 아닌 서버 시작 단계에서 실패)
+        gpt_service = GPTService(api_key=settings.gemini_api_key)
+        session_store = create_session_store()
+        app.state.gpt_service = gpt_service
+        app.state.session_store = session_store
+        app.state.risk_service = RiskAnalysisService(gpt_service, session_store)
+        
+        if settings.gemini_warmup:
+            await gpt_service.awarmup()
+        
+        yield
+    finally:
+        # 오류로 종료되어도 세션 저장소(Redis 연결)를 닫고 남은 로그 출력
+        try:
+            if session_store is not None:
+                await session_store.aclose()
+        finally:
+            listener.stop()
+
+
+def get_gpt_service(request: Request) -> GPTService:
+    """lifespan에서 생성한 GPTService"""
+    return request.app.state.gpt_service
+
+
+def get_session_store(request: Request) -> SessionStore:
+    """lifespan에서 생성한 세션 저장소"""
+    return request.app.state.session_store
+
+
+def get_risk_service(request: Request) -> RiskAnalysisService:
+    """lifespan에서 생성한 리스크 분석 서비스"""
+    return request.app.state.risk_service
 
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="Risk Manager API",
     description="사업 시작 전 리스크를 수치적으로 분석해주는 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -31,11 +117,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 서비스 초기화
-session_store = SessionStore()
-gpt_service = GPTService(api_key=settings.gemini_api_key)
-risk_service = RiskAnalysisService(gpt_service, session_store)
-
 
 @app.get("/")
 async def root():
@@ -49,18 +130,38 @@ async def root():
     }
 
 
+# 헬스체크 응답 캐시 (만료 시각, 직렬화된 JSON), 잦은 프로브 요청은 캐시된 바이트로 응답
+_HEALTH_CACHE_TTL = 1.0
+_health_cache = (0.0, b"")
+
+
 @app.get("/api/v1/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(
+    gpt_service: GPTService = Depends(get_gpt_service),
+    session_store: SessionStore = Depends(get_session_store)
+):
     """헬스체크"""
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0",
-        timestamp=datetime.now().isoformat()
-    )
+    global _health_cache
+    now = time.monotonic()
+    expires_at, body = _health_cache
+    if now >= expires_at:
+        body = HealthResponse(
+            status="healthy",
+            version="1.0.0",
+            timestamp=datetime.now().isoformat(),
+            llm_cache=gpt_service.cache_stats(),
+            active_sessions=session_store.session_count()
+        ).model_dump_json().encode("utf-8")
+        _health_cache = (now + _HEALTH_CACHE_TTL, body)
+    
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/v1/analyze/initial", response_model=InitialAnalysisResponse)
-async def analyze_initial_business(business_input: InitialBusinessInput):
+async def analyze_initial_business(
+    business_input: InitialBusinessInput,
+    risk_service: RiskAnalysisService = Depends(get_risk_service)
+):
     """
     1단계: 초기 사업 정보 분석
     
@@ -68,7 +169,7 @@ async def analyze_initial_business(business_input: InitialBusinessInput):
     - 시스템이 업종을 분류하고 적합한 분석 기법 2개를 선택
     """
     try:
-        result = risk_service.analyze_initial_business(business_input)
+        result = await risk_service.analyze_initial_business(business_input)
         return result
     except ValueError as e:
         # 입력 검증 실패 (비즈니스 아이디어가 아님)
@@ -78,14 +179,17 @@ async def analyze_initial_business(business_input: InitialBusinessInput):
 
 
 @app.post("/api/v1/analyze/questions", response_model=QuestionGenerationResponse)
-async def generate_questions(request: QuestionGenerationRequest):
+async def generate_questions(
+    request: QuestionGenerationRequest,
+    risk_service: RiskAnalysisService = Depends(get_risk_service)
+):
     """
     3단계: 맞춤형 질문 생성
     
     - 선택된 분석 기법에 따라 GPT가 10~20개의 질문을 생성
     """
     try:
-        result = risk_service.generate_questions(request.session_id)
+        result = await risk_service.generate_questions(request.session_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -94,27 +198,71 @@ async def generate_questions(request: QuestionGenerationRequest):
 
 
 @app.post("/api/v1/analyze/report", response_model=FinalRiskReport)
-async def generate_risk_report(answer_request: AnswerSubmissionRequest):
+async def generate_risk_report(
+    answer_request: AnswerSubmissionRequest,
+    risk_service: RiskAnalysisService = Depends(get_risk_service)
+):
     """
     5단계: 최종 리스크 보고서 생성
     
     - 사용자의 답변을 분석하여 종합 리스크 보고서 생성
     """
     try:
-        result = risk_service.generate_final_report(answer_request)
-        return result
+        result = await risk_service.generate_final_report(answer_request)
+        # 응답 모델 재검증·jsonable_encoder 변환 없이 pydantic 직렬화 한 번으로 응답
+        return Response(content=result.model_dump_json(), media_type="application/json")
+    except ValidationError as e:
+        # Gemini 응답 값이 보고서 스키마를 벗어난 경우 (ValueError 하위 클래스이므로 먼저 처리)
+        raise HTTPException(status_code=500, detail=f"보고서 생성 중 오류가 발생했습니다: {str(e)}")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"보고서 생성 중 오류가 발생했습니다: {str(e)}")
 
 
+@app.post("/api/v1/analyze/report/stream")
+async def generate_risk_report_stream(
+    answer_request: AnswerSubmissionRequest,
+    risk_service: RiskAnalysisService = Depends(get_risk_service)
+):
+    """
+    5단계: 최종 리스크 보고서 스트리밍 생성 (NDJSON)
+    
+    - 분석 기법별 OSD 리스크가 완성되는 대로 한 줄씩 전송
+    - 마지막 줄은 {"type": "final_report", "data": 최종 보고서}
+    - 전송 도중 오류가 나면 마지막 줄로 {"type": "error", "detail": 오류 내용}을 전송
+    """
+    try:
+        events = await risk_service.generate_final_report_stream(answer_request)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    def encode(event) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+        return (json.dumps(jsonable_encoder(event), ensure_ascii=False) + "\n").encode("utf-8")
+    
+    async def ndjson():
+        try:
+            async for event in events:
+                yield encode(event)
+        except Exception as e:
+            # 응답이 이미 시작되어 상태 코드를 바꿀 수 없으므로 마지막 줄로 오류를 알림
+            logger.exception("보고서 스트리밍 중 오류")
+            yield encode({"type": "error", "detail": f"보고서 생성 중 오류가 발생했습니다: {str(e)}"})
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @app.get("/api/v1/session/{session_id}")
-async def get_session_info(session_id: str):
+async def get_session_info(
+    session_id: str,
+    session_store: SessionStore = Depends(get_session_store)
+):
     """
     세션 정보 조회 (디버깅/개발용)
     """
-    session = session_store.get_session(session_id)
+    session = await session_store.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
     
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, Any, Literal
 from enum import Enum
 
 
@@ -87,10 +87,12 @@ class QuestionGenerationRequest(BaseModel):
 # 3단계 응답: 생성된 질문들
 class Question(BaseModel):
     """개별 질문"""
+    model_config = ConfigDict(frozen=True)
+    
     question_id: str = Field(..., description="질문 ID (예: method1_q1)")
     method: AnalysisMethod = Field(..., description="해당 분석 기법")
     question_text: str = Field(..., description="질문 내용")
-    question_type: str = Field(..., description="답변 유형 (text/number/choice)", pattern="^(text|number|choice)$")
+    question_type: Literal["text", "number", "choice"] = Field(..., description="답변 유형 (text/number/choice)")
     choices: Optional[List[str]] = Field(None, description="선택형인 경우 선택지")
 
 
@@ -117,6 +119,8 @@ class AnswerSubmissionRequest(BaseModel):
 # 5단계 응답: 최종 리스크 보고서
 class OSDScore(BaseModel):
     """OSD 기반 리스크 측정"""
+    model_config = ConfigDict(frozen=True)
+    
     occurrence: int = Field(..., description="발생 가능성 (1~10)", ge=1, le=10)
     severity: int = Field(..., description="심각도 (1~10)", ge=1, le=10)
     detection: int = Field(..., description="발견 가능성 (1~10, 낮을수록 발견 어려움)", ge=1, le=10)
@@ -126,6 +130,8 @@ class OSDScore(BaseModel):
 
 class CostBreakdown(BaseModel):
     """비용 구성 요소"""
+    model_config = ConfigDict(frozen=True)
+    
     capex: float = Field(..., description="초기 투자비 (CAPEX)")
     opex: float = Field(..., description="운영비 (OPEX)")
     risk_impact_cost: float = Field(..., description="리스크 영향 비용")
@@ -134,6 +140,8 @@ class CostBreakdown(BaseModel):
 
 class CashLossAnalysis(BaseModel):
     """현금 손실액 분석"""
+    model_config = ConfigDict(frozen=True)
+    
     total_expected_loss: float = Field(..., description="총 예상 손실액 (원)")
     cost_breakdown: CostBreakdown = Field(..., description="비용 구성")
     loss_by_risk: List[Dict[str, Any]] = Field(..., description="리스크별 손실액")
@@ -142,6 +150,8 @@ class CashLossAnalysis(BaseModel):
 
 class AIRecommendation(BaseModel):
     """AI 조언"""
+    model_config = ConfigDict(frozen=True)
+    
     category: str = Field(..., description="조언 카테고리")
     priority: str = Field(..., description="우선순위 (높음/중간/낮음)")
     action: str = Field(..., description="권장 액션")
@@ -186,3 +196,36 @@ class HealthResponse(BaseModel):
     status: str
     version: str
     timestamp: str
+    llm_cache: Optional[Dict[str, Dict[str, int]]] = None
+    active_sessions: Optional[int] = None
+
+
+# Gemini 구조화 응답 스키마 (response_schema, 기본값 없이 정의)
+class GeneratedQuestion(BaseModel):
+    """Gemini가 생성한 질문 1개"""
+    question_text: str = Field(..., description="질문 내용")
+    question_type: Literal["text", "number", "choice"] = Field(..., description="답변 유형")
+    choices: Optional[List[str]] = Field(..., description="선택형인 경우 선택지, 아니면 null")
+
+
+class GeneratedQuestionList(BaseModel):
+    """분석 기법 1개에 대한 질문 목록"""
+    questions: List[GeneratedQuestion] = Field(..., description="질문 2~3개")
+
+
+class GeneratedMethodSection(BaseModel):
+    """통합 질문 응답의 분석 기법별 구간"""
+    method_number: int = Field(..., description="분석 기법 번호 (1부터)")
+    questions: List[GeneratedQuestion] = Field(..., description="질문 2~3개")
+
+
+class GeneratedQuestionSet(BaseModel):
+    """모든 분석 기법의 질문 (기법 순서대로)"""
+    sections: List[GeneratedMethodSection] = Field(..., description="분석 기법별 질문")
+
+
+class BusinessValidationResult(BaseModel):
+    """입력 검증 결과"""
+    is_valid: bool = Field(..., description="비즈니스 아이디어 여부")
+    message: str = Field(..., description="사용자에게 보여줄 메시지")
+    suggestion: str = Field(..., description="NO인 경우 올바른 입력 예시, YES인 경우 빈 문자열")
@@ -1,10 +1,37 @@
 """
 OSD (Occurrence × Severity × Detection) 기반 리스크 계산 엔진
 """
+from bisect import bisect_right
+from functools import lru_cache
+from operator import mul
 from typing import List, Dict, Any, Tuple
 from .models import IndustryCategory, AnalysisMethod, OSDScore
 
 
+# 위험 수준 / 등급 구간 경계 (OSD 원점수, 경계값은 다음 구간에 포함)
+_RISK_LEVEL_THRESHOLDS = (100, 300, 600)
+_RISK_LEVELS = ("낮음", "중간", "높음", "매우높음")
+_RISK_GRADE_THRESHOLDS = (50, 100, 200, 400, 700)
+_RISK_GRADES = ("A", "B", "C", "D", "E", "F")
+
+# 점수(0~1000)별 위험 수준 / 등급 (조회 한 번으로 변환)
+_LEVEL_BY_SCORE = tuple(
+    _RISK_LEVELS[bisect_right(_RISK_LEVEL_THRESHOLDS, score)] for score in range(1001)
+)
+_GRADE_BY_SCORE = tuple(
+    _RISK_GRADES[bisect_right(_RISK_GRADE_THRESHOLDS, score)] for score in range(1001)
+)
+
+# CAPEX/OPEX 분류 비율 (간단히 6:4 비율로)
+_CAPEX_OPEX_ITEMS = (("capex", 0.6), ("opex", 0.4))
+
+# 보정 계수가 없는 업종의 보정 값 표 (원래 값 그대로)
+_IDENTITY_CORRECTION = (tuple(range(11)),) * 3
+
+# 심각도(인덱스)별 영향 비율: 1~3 낮음 10%, 4~6 중간 30%, 7~10 높음 60% (0은 기본값 30%)
+_SEVERITY_IMPACT = (0.3, 0.1, 0.1, 0.1, 0.3, 0.3, 0.3, 0.6, 0.6, 0.6, 0.6)
+
+
 class OSDRiskEngine:
     """OSD 기반 리스크 측정 엔진"""
     
@@ -20,6 +47,21 @@ class OSDRiskEngine:
         IndustryCategory.GENERAL_BUSINESS: {"O": 1.0, "S": 1.0, "D": 1.0},
     }
     
+    # 업종별 (O, S, D) 보정 계수 튜플 (클래스 정의 시 1회 계산)
+    _CORRECTION_FACTORS = {
+        industry: (correction["O"], correction["S"], correction["D"])
+        for industry, correction in INDUSTRY_CORRECTION.items()
+    }
+    
+    # 업종별 보정 후 (O, S, D) 값 표 (원래 값 0~10 → 보정 값, 업종 8개 × 3 × 11칸)
+    _CORRECTED_VALUES = {
+        industry: tuple(
+            tuple(min(10, round(value * factor)) for value in range(11))
+            for factor in factors
+        )
+        for industry, factors in _CORRECTION_FACTORS.items()
+    }
+    
     @staticmethod
     def calculate_osd_score(occurrence: int, severity: int, detection: int) -> int:
         """
@@ -46,14 +88,7 @@ class OSDRiskEngine:
         Returns:
             str: 위험 수준
         """
-        if risk_score < 100:
-            return "낮음"
-        elif risk_score < 300:
-            return "중간"
-        elif risk_score < 600:
-            return "높음"
-        else:
-            return "매우높음"
+        return _LEVEL_BY_SCORE[min(max(risk_score, 0), 1000)]
     
     @staticmethod
     def get_risk_grade(risk_score: int) -> str:
@@ -66,18 +101,7 @@ class OSDRiskEngine:
         Returns:
             str: 리스크 등급 (A~F)
         """
-        if risk_score < 50:
-            return "A"
-        elif risk_score < 100:
-            return "B"
-        elif risk_score < 200:
-            return "C"
-        elif risk_score < 400:
-            return "D"
-        elif risk_score < 700:
-            return "E"
-        else:
-            return "F"
+        return _GRADE_BY_SCORE[min(max(risk_score, 0), 1000)]
     
     @staticmethod
     def apply_industry_correction(
@@ -94,18 +118,26 @@ class OSDRiskEngine:
         Returns:
             Dict: 보정된 OSD 값
         """
-        correction = OSDRiskEngine.INDUSTRY_CORRECTION.get(
-            industry, 
-            {"O": 1.0, "S": 1.0, "D": 1.0}
+        o, s, d = osd_values["O"], osd_values["S"], osd_values["D"]
+        
+        # 0~10 범위는 미리 계산한 표에서 조회, 범위 밖이면 직접 계산
+        if 0 <= o <= 10 and 0 <= s <= 10 and 0 <= d <= 10:
+            o_table, s_table, d_table = OSDRiskEngine._CORRECTED_VALUES.get(
+                industry,
+                _IDENTITY_CORRECTION
+            )
+            return {"O": o_table[o], "S": s_table[s], "D": d_table[d]}
+        
+        o_factor, s_factor, d_factor = OSDRiskEngine._CORRECTION_FACTORS.get(
+            industry,
+            (1.0, 1.0, 1.0)
         )
         
-        corrected = {
-            "O": min(10, round(osd_values["O"] * correction["O"])),
-            "S": min(10, round(osd_values["S"] * correction["S"])),
-            "D": min(10, round(osd_values["D"] * correction["D"]))
+        return {
+            "O": min(10, round(o * o_factor)),
+            "S": min(10, round(s * s_factor)),
+            "D": min(10, round(d * d_factor))
         }
-        
-        return corrected
     
     @staticmethod
     def calculate_overall_risk(osd_scores: List[OSDScore]) -> Tuple[float, str, str]:
@@ -127,10 +159,7 @@ class OSDRiskEngine:
         if len(sorted_scores) == 1:
             avg_score_osd = sorted_scores[0]
         else:
-            # 상위 3개에 더 높은 가중치
-            weights = [0.4, 0.3, 0.2] + [0.1 / max(1, len(sorted_scores) - 3)] * (len(sorted_scores) - 3)
-            weights = weights[:len(sorted_scores)]
-            avg_score_osd = sum(s * w for s, w in zip(sorted_scores, weights))
+            avg_score_osd = sum(map(mul, sorted_scores, _overall_weights(len(sorted_scores))))
         
         # OSD 점수(1~1000)를 100점 만점으로 환산
         # 1000점 = 100점, 비례식 적용
@@ -143,6 +172,25 @@ class OSDRiskEngine:
         return round(avg_score_100, 2), level, grade
 
 
+@lru_cache(maxsize=64)
+def _overall_weights(count: int) -> Tuple[float, ...]:
+    """리스크 개수별 가중치 (상위 3개에 0.4/0.3/0.2, 나머지는 0.1을 균등 분배)"""
+    weights = (0.4, 0.3, 0.2) + (0.1 / max(1, count - 3),) * (count - 3)
+    return weights[:count]
+
+
+def _risk_probability_and_loss(osd_score: OSDScore, total_investment: int) -> Tuple[float, float]:
+    """리스크 1개의 (발생 확률, 예상 손실액) (예상 손실 = 확률 × 심각도별 영향 비율 × 총 투자액)"""
+    # 리스크 점수를 확률로 변환 (0~1)
+    probability = min(1.0, osd_score.risk_score / 1000.0)
+    
+    # 심각도에 따른 영향 비율 (범위 밖이면 기본값 30%)
+    severity = osd_score.severity
+    impact_ratio = _SEVERITY_IMPACT[severity] if 0 <= severity <= 10 else 0.3
+    
+    return probability, probability * impact_ratio * total_investment
+
+
 class CostAnalysisEngine:
     """현금 손실액 계산 엔진"""
     
@@ -207,6 +255,18 @@ class CostAnalysisEngine:
         }
     }
     
+    # 업종별 (비용 항목, 비율) 튜플 (클래스 정의 시 1회 계산)
+    _COST_STRUCTURE_ITEMS = {
+        industry: tuple(structure.items())
+        for industry, structure in INDUSTRY_COST_STRUCTURE.items()
+    }
+    
+    # 업종별 CAPEX/OPEX + 비용 항목 튜플 (손실액 계산 시 한 번의 순회로 모두 계산)
+    _FULL_STRUCTURE_ITEMS = {
+        industry: _CAPEX_OPEX_ITEMS + items
+        for industry, items in _COST_STRUCTURE_ITEMS.items()
+    }
+    
     @staticmethod
     def estimate_cost_breakdown(
         investment_amount: int,
@@ -222,16 +282,12 @@ class CostAnalysisEngine:
         Returns:
             Dict: 비용 항목별 금액
         """
-        structure = CostAnalysisEngine.INDUSTRY_COST_STRUCTURE.get(
+        items = CostAnalysisEngine._COST_STRUCTURE_ITEMS.get(
             industry,
-            CostAnalysisEngine.INDUSTRY_COST_STRUCTURE[IndustryCategory.GENERAL_BUSINESS]
+            CostAnalysisEngine._COST_STRUCTURE_ITEMS[IndustryCategory.GENERAL_BUSINESS]
         )
         
-        breakdown = {}
-        for category, ratio in structure.items():
-            breakdown[category] = investment_amount * ratio
-        
-        return breakdown
+        return {category: investment_amount * ratio for category, ratio in items}
     
     @staticmethod
     def calculate_risk_impact_cost(
@@ -248,26 +304,7 @@ class CostAnalysisEngine:
         Returns:
             float: 해당 리스크로 인한 예상 손실액
         """
-        # 리스크 점수를 확률로 변환 (0~1)
-        probability = min(1.0, osd_score.risk_score / 1000.0)
-        
-        # 심각도에 따른 영향 비율
-        severity_impact = {
-            range(1, 4): 0.1,    # 낮은 심각도: 10% 영향
-            range(4, 7): 0.3,    # 중간 심각도: 30% 영향
-            range(7, 11): 0.6    # 높은 심각도: 60% 영향
-        }
-        
-        impact_ratio = 0.3  # 기본값
-        for range_obj, ratio in severity_impact.items():
-            if osd_score.severity in range_obj:
-                impact_ratio = ratio
-                break
-        
-        # 예상 손실 = 확률 × 영향 비율 × 총 투자액
-        expected_loss = probability * impact_ratio * total_investment
-        
-        return expected_loss
+        return _risk_probability_and_loss(osd_score, total_investment)[1]
     
     @staticmethod
     def calculate_total_expected_loss(
@@ -286,36 +323,32 @@ class CostAnalysisEngine:
         Returns:
             Dict: 손실액 분석 결과
         """
-        # 비용 구성
-        cost_details = CostAnalysisEngine.estimate_cost_breakdown(
-            investment_amount,
-            industry
+        # CAPEX/OPEX 분류와 비용 구성을 한 번에 계산
+        items = CostAnalysisEngine._FULL_STRUCTURE_ITEMS.get(
+            industry,
+            CostAnalysisEngine._FULL_STRUCTURE_ITEMS[IndustryCategory.GENERAL_BUSINESS]
         )
+        cost_details = {category: investment_amount * ratio for category, ratio in items}
+        capex = cost_details.pop("capex")
+        opex = cost_details.pop("opex")
         
-        # CAPEX/OPEX 분류 (간단히 6:4 비율로)
-        capex = investment_amount * 0.6
-        opex = investment_amount * 0.4
-        
-        # 각 리스크별 손실액 계산
+        # 각 리스크별 손실액 계산 (확률과 손실액을 한 번의 순회로 계산)
         loss_by_risk = []
         total_risk_cost = 0
         
         for osd in osd_scores:
-            risk_cost = CostAnalysisEngine.calculate_risk_impact_cost(
-                osd,
-                investment_amount
-            )
+            probability, risk_cost = _risk_probability_and_loss(osd, investment_amount)
             total_risk_cost += risk_cost
             
             loss_by_risk.append({
                 "risk_description": osd.description,
                 "osd_score": osd.risk_score,
-                "probability": min(1.0, osd.risk_score / 1000.0),
+                "probability": probability,
                 "expected_loss": risk_cost
             })
         
-        # 확률 가중 총 손실액
-        probability_weighted_loss = sum(item["expected_loss"] for item in loss_by_risk)
+        # 확률 가중 총 손실액 (리스크별 손실액의 합 = 리스크 영향 비용 합계)
+        probability_weighted_loss = total_risk_cost
         
         return {
             "total_expected_loss": probability_weighted_loss,
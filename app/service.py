@@ -1,11 +1,20 @@
-from typing import Dict, List
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+from pydantic import BaseModel, TypeAdapter
 import uuid
 from .models import (
     InitialBusinessInput,
     InitialAnalysisResponse,
+    IndustryCategoryInfo,
     QuestionGenerationResponse,
     Question,
+    Answer,
     AnswerSubmissionRequest,
     FinalRiskReport,
     MethodAnalysisResult,
@@ -13,41 +22,221 @@ from .models import (
     CashLossAnalysis,
     CostBreakdown,
     AIRecommendation,
-    IndustryCategory
+    IndustryCategory,
+    AnalysisMethod
 )
-from .classifier import IndustryClassifier
+from .classifier import classify_business, select_analysis_methods
 from .gpt_service import GPTService
 from .risk_engine import OSDRiskEngine, CostAnalysisEngine
+from .config import settings
+
+try:
+    import redis
+    import redis.asyncio
+except ImportError:  # redis 미설치 시 인메모리 세션 저장소만 사용
+    redis = None
+
+
+# 기법명 → AnalysisMethod (세션에 enum 또는 문자열로 저장된 기법을 생성자 호출 없이 변환)
+_METHOD_BY_VALUE = AnalysisMethod._value2member_map_
+
+# 소비되지 않은 선행 질문 생성 작업 최대 보관 수 (초과 시 가장 오래된 작업 취소)
+_MAX_PENDING_QUESTION_TASKS = 1024
+
+# 목록 검증기/직렬화기 (요소마다 생성자·model_dump를 호출하지 않고 목록 전체를 한 번에 처리)
+_QUESTION_LIST = TypeAdapter(List[Question])
+_OSD_LIST = TypeAdapter(List[OSDScore])
+_RECOMMENDATION_LIST = TypeAdapter(List[AIRecommendation])
+_CATEGORY_LIST = TypeAdapter(List[IndustryCategoryInfo])
+_ANSWER_LIST = TypeAdapter(List[Answer])
+
+
+def _build_model(model_class, **data):
+    """
+    서버가 직접 계산한 값으로 응답 모델 생성
+    
+    trusted_internal_models 설정 시 필드 검증을 생략 (model_construct),
+    외부 입력(요청 본문, 세션 저장소에서 복원한 데이터, Gemini 응답에서 파싱한 값)에는 사용하지 않음
+    """
+    if settings.trusted_internal_models:
+        return model_class.model_construct(**data)
+    return model_class(**data)
+
+
+def _json_default(value):
+    """세션을 Redis에 저장할 때 pydantic 모델(질문 등)을 JSON 호환 dict로 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"JSON으로 직렬화할 수 없는 값입니다: {type(value).__name__}")
 
 
 class SessionStore:
-    """간단한 인메모리 세션 저장소 (실제로는 Redis나 DB 사용 권장)"""
+    """인메모리 세션 저장소 (최대 개수 + 유효 시간 제한, 여러 워커에서는 RedisSessionStore 사용)"""
     
-    def __init__(self):
-        self.sessions: Dict[str, Dict] = {}
+    # 여러 워커가 세션을 공유하는지 (공유하면 다음 요청이 다른 워커로 갈 수 있음)
+    shared = False
     
-    def create_session(self, session_data: Dict) -> str:
-        """새 세션 생성"""
-        session_id = str(uuid.uuid4())
-        self.sessions[session_id] = {
+    def __init__(self, max_sessions: int = 10000, ttl_seconds: int = 3600):
+        """
+        Args:
+            max_sessions: 최대 세션 수 (초과 시 가장 오래 사용되지 않은 세션부터 제거)
+            ttl_seconds: 세션 유효 시간(초), 생성·업데이트 시마다 갱신
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        # 세션 ID → (만료 시각, 세션 데이터), 최근 사용 순서 유지
+        self.sessions: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._removal_listeners: List[Callable[[str], None]] = []
+    
+    def add_removal_listener(self, listener: Callable[[str], None]):
+        """세션이 삭제·만료·개수 초과로 제거될 때 세션 ID로 호출할 함수 등록"""
+        self._removal_listeners.append(listener)
+    
+    def _notify_removed(self, session_id: str):
+        """제거된 세션을 등록된 함수에 알림"""
+        for listener in self._removal_listeners:
+            listener(session_id)
+    
+    @staticmethod
+    def _new_session(session_data: Dict) -> Tuple[str, Dict]:
+        """새 세션 ID와 생성 시각을 붙인 세션 데이터"""
+        session = {
             **session_data,
             "created_at": datetime.now().isoformat()
         }
+        return str(uuid.uuid4()), session
+    
+    async def create_session(self, session_data: Dict) -> str:
+        """새 세션 생성"""
+        session_id, session = self._new_session(session_data)
+        evicted = []
+        with self._lock:
+            self.sessions[session_id] = (time.monotonic() + self.ttl_seconds, session)
+            while len(self.sessions) > self.max_sessions:
+                evicted.append(self.sessions.popitem(last=False)[0])
+        for evicted_id in evicted:
+            self._notify_removed(evicted_id)
         return session_id
     
-    def get_session(self, session_id: str) -> Dict:
-        """세션 조회"""
-        return self.sessions.get(session_id)
+    async def get_session(self, session_id: str) -> Optional[Dict]:
+        """세션 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self.sessions.get(session_id)
+            if entry is None:
+                return None
+            expires_at, session = entry
+            if expires_at > time.monotonic():
+                self.sessions.move_to_end(session_id)
+                return session
+            del self.sessions[session_id]
+        self._notify_removed(session_id)
+        return None
     
-    def update_session(self, session_id: str, updates: Dict):
-        """세션 업데이트"""
-        if session_id in self.sessions:
-            self.sessions[session_id].update(updates)
+    async def update_session(self, session_id: str, updates: Dict):
+        """세션 업데이트 (유효 시간 갱신)"""
+        with self._lock:
+            entry = self.sessions.get(session_id)
+            if entry is not None:
+                session = entry[1]
+                session.update(updates)
+                self.sessions[session_id] = (time.monotonic() + self.ttl_seconds, session)
+                self.sessions.move_to_end(session_id)
     
-    def delete_session(self, session_id: str):
+    async def delete_session(self, session_id: str):
         """세션 삭제"""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        with self._lock:
+            self.sessions.pop(session_id, None)
+        self._notify_removed(session_id)
+    
+    def session_count(self) -> Optional[int]:
+        """보관 중인 세션 수 (만료되었지만 아직 제거되지 않은 세션 포함)"""
+        return len(self.sessions)
+    
+    async def aclose(self):
+        """저장소 정리 (인메모리 저장소는 할 일 없음)"""
+
+
+class RedisSessionStore(SessionStore):
+    """Redis 세션 저장소 (여러 워커가 세션 공유, 키마다 TTL 적용, redis.asyncio로 이벤트 루프를 막지 않음)"""
+    
+    shared = True
+    
+    def __init__(self, redis_url: str, ttl_seconds: int = 3600, client=None):
+        """
+        Args:
+            redis_url: Redis 접속 URL (예: redis://localhost:6379/0)
+            ttl_seconds: 세션 유효 시간(초), 생성·업데이트 시마다 갱신
+            client: 이미 만든 redis.asyncio 클라이언트 (없으면 redis_url로 생성)
+        """
+        if client is None:
+            if redis is None:
+                raise ValueError("redis_url을 사용하려면 redis 패키지를 설치해야 합니다.")
+            client = redis.asyncio.Redis.from_url(redis_url)
+        # 인메모리 세션 목록은 사용하지 않으므로 최대 개수 제한 없음
+        super().__init__(max_sessions=0, ttl_seconds=ttl_seconds)
+        self.client = client
+    
+    @staticmethod
+    def _key(session_id: str) -> str:
+        """세션 ID → Redis 키"""
+        return f"session:{session_id}"
+    
+    @staticmethod
+    def _dumps(session: Dict) -> str:
+        """세션 → JSON 문자열"""
+        return json.dumps(session, ensure_ascii=False, default=_json_default)
+    
+    async def create_session(self, session_data: Dict) -> str:
+        """새 세션 생성"""
+        session_id, session = self._new_session(session_data)
+        await self.client.set(self._key(session_id), self._dumps(session), ex=self.ttl_seconds)
+        return session_id
+    
+    async def get_session(self, session_id: str) -> Optional[Dict]:
+        """세션 조회 (없거나 만료되었으면 None)"""
+        raw = await self.client.get(self._key(session_id))
+        return json.loads(raw) if raw is not None else None
+    
+    async def update_session(self, session_id: str, updates: Dict):
+        """세션 업데이트 (읽기-수정-쓰기를 WATCH 트랜잭션으로 원자적으로 수행)"""
+        key = self._key(session_id)
+        async with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    raw = await pipe.get(key)
+                    if raw is None:
+                        await pipe.unwatch()
+                        return
+                    session = json.loads(raw)
+                    session.update(updates)
+                    pipe.multi()
+                    pipe.set(key, self._dumps(session), ex=self.ttl_seconds)
+                    await pipe.execute()
+                    return
+                except redis.WatchError:
+                    continue
+    
+    async def delete_session(self, session_id: str):
+        """세션 삭제"""
+        await self.client.delete(self._key(session_id))
+        self._notify_removed(session_id)
+    
+    def session_count(self) -> Optional[int]:
+        """Redis 세션 수는 집계하지 않음 (None)"""
+        return None
+    
+    async def aclose(self):
+        """Redis 연결 종료"""
+        await self.client.aclose()
+
+
+def create_session_store() -> SessionStore:
+    """설정에 따라 세션 저장소 생성 (redis_url이 있으면 Redis, 없으면 인메모리)"""
+    if settings.redis_url:
+        return RedisSessionStore(settings.redis_url, settings.session_ttl_seconds)
+    return SessionStore(settings.max_sessions, settings.session_ttl_seconds)
 
 
 class RiskAnalysisService:
@@ -56,9 +245,27 @@ class RiskAnalysisService:
     def __init__(self, gpt_service: GPTService, session_store: SessionStore):
         self.gpt_service = gpt_service
         self.session_store = session_store
-        self.classifier = IndustryClassifier()
+        
+        # 세션 ID → (세션 만료 시각, 검증과 동시에 미리 시작한 질문 생성 작업), 생성 순서 유지
+        self._pending_questions: "OrderedDict[str, Tuple[float, asyncio.Task]]" = OrderedDict()
+        session_store.add_removal_listener(self._cancel_pending_questions)
     
-    def analyze_initial_business(
+    def _cancel_pending_questions(self, session_id: str):
+        """세션의 선행 질문 생성 작업 취소 (세션이 제거된 경우)"""
+        entry = self._pending_questions.pop(session_id, None)
+        if entry is not None:
+            entry[1].cancel()
+    
+    def _prune_pending_questions(self):
+        """세션이 만료되었거나 최대 보관 수를 넘은 선행 질문 생성 작업 취소 (오래된 것부터)"""
+        now = time.monotonic()
+        while self._pending_questions:
+            session_id, (expires_at, _) = next(iter(self._pending_questions.items()))
+            if expires_at > now and len(self._pending_questions) <= _MAX_PENDING_QUESTION_TASKS:
+                break
+            self._cancel_pending_questions(session_id)
+    
+    async def analyze_initial_business(
         self, 
         business_input: InitialBusinessInput
     ) -> InitialAnalysisResponse:
@@ -67,27 +274,46 @@ class RiskAnalysisService:
         - 입력 검증
         - 업종 분류
         - 분석 기법 선택
+        - (speculative_questions 설정 시) 검증과 동시에 질문 생성 시작
+          (세션을 여러 워커가 공유하면 질문 요청이 다른 워커로 갈 수 있으므로 생략)
         """
-        # 1차 입력 검증: 비즈니스 아이디어인지 확인
-        validation_result = self.gpt_service.validate_business_input(
+        # 업종 분류 (로컬 계산이므로 검증 전에 수행)
+        categories = classify_business(
             business_input.businessDescription
         )
         
+        # 분석 기법 선택
+        methods = select_analysis_methods(categories)
+        
+        # 검증은 대부분 통과하므로 질문 생성을 미리 시작 (실패 시 취소)
+        question_task = None
+        if settings.speculative_questions and not self.session_store.shared:
+            question_task = asyncio.create_task(self.gpt_service.agenerate_questions(
+                business_input.businessName,
+                business_input.businessDescription,
+                business_input.investmentAmount,
+                methods
+            ))
+        
+        # 1차 입력 검증: 비즈니스 아이디어인지 확인
+        try:
+            validation_result = await self.gpt_service.avalidate_business_input(
+                business_input.businessDescription
+            )
+        except BaseException:
+            if question_task is not None:
+                question_task.cancel()
+            raise
+        
         if not validation_result["is_valid"]:
+            if question_task is not None:
+                question_task.cancel()
             # 검증 실패 시 예외 발생
             error_message = validation_result["message"]
             if validation_result["suggestion"]:
                 error_message += f"\n\n{validation_result['suggestion']}"
             raise ValueError(error_message)
         
-        # 업종 분류
-        categories = self.classifier.classify_business(
-            business_input.businessDescription
-        )
-        
-        # 분석 기법 선택
-        methods = self.classifier.select_analysis_methods(categories)
-        
         # 선택 이유 생성
         reasoning = f"{categories[0].category_name} 업종으로 분류되어 {methods[0].value}과 {methods[1].value} 분석 기법이 선택되었습니다."
         
@@ -96,11 +322,23 @@ class RiskAnalysisService:
             "business_name": business_input.businessName,
             "business_description": business_input.businessDescription,
             "investment_amount": business_input.investmentAmount,
-            "categories": [cat.dict() for cat in categories],
-            "methods": [method.value for method in methods],
+            "categories": _CATEGORY_LIST.dump_python(categories, mode="json"),
+            "methods": methods,
             "stage": "initial_analyzed"
         }
-        session_id = self.session_store.create_session(session_data)
+        try:
+            session_id = await self.session_store.create_session(session_data)
+        except BaseException:
+            if question_task is not None:
+                question_task.cancel()
+            raise
+        
+        if question_task is not None:
+            self._pending_questions[session_id] = (
+                time.monotonic() + self.session_store.ttl_seconds,
+                question_task
+            )
+            self._prune_pending_questions()
         
         return InitialAnalysisResponse(
             session_id=session_id,
@@ -109,14 +347,14 @@ class RiskAnalysisService:
             reasoning=reasoning
         )
     
-    def generate_questions(
+    async def generate_questions(
         self, 
         session_id: str
     ) -> QuestionGenerationResponse:
         """
         3단계: 맞춤형 질문 생성
         """
-        session = self.session_store.get_session(session_id)
+        session = await self.session_store.get_session(session_id)
         if not session:
             raise ValueError("유효하지 않은 세션 ID입니다.")
         
@@ -125,21 +363,31 @@ class RiskAnalysisService:
         business_description = session["business_description"]
         investment_amount = session.get("investment_amount")
         
-        # 문자열을 AnalysisMethod enum으로 변환
-        from .models import AnalysisMethod
-        methods = [AnalysisMethod(m) for m in session["methods"]]
+        # 세션의 기법을 AnalysisMethod enum으로 변환 (Redis 세션은 문자열)
+        methods = [_METHOD_BY_VALUE[m] for m in session["methods"]]
         
-        # GPT로 질문 생성
-        questions = self.gpt_service.generate_questions(
-            business_name,
-            business_description,
-            investment_amount,
-            methods
-        )
+        # 1단계에서 미리 시작한 질문 생성 결과 사용 (없거나 실패하면 새로 생성)
+        questions = None
+        entry = self._pending_questions.pop(session_id, None)
+        if entry is not None:
+            question_task = entry[1]
+            try:
+                questions = await question_task
+            except Exception:
+                questions = None
+        
+        # GPT로 질문 생성 (기법별 호출 동시 실행)
+        if questions is None:
+            questions = await self.gpt_service.agenerate_questions(
+                business_name,
+                business_description,
+                investment_amount,
+                methods
+            )
         
         # 세션 업데이트
-        self.session_store.update_session(session_id, {
-            "questions": [q.dict() for q in questions],
+        await self.session_store.update_session(session_id, {
+            "questions": list(questions),
             "stage": "questions_generated"
         })
         
@@ -149,7 +397,7 @@ class RiskAnalysisService:
             total_questions=len(questions)
         )
     
-    def generate_final_report(
+    async def generate_final_report(
         self, 
         answer_request: AnswerSubmissionRequest
     ) -> FinalRiskReport:
@@ -157,41 +405,109 @@ class RiskAnalysisService:
         5단계: OSD 기반 최종 리스크 보고서 생성
         """
         session_id = answer_request.session_id
-        session = self.session_store.get_session(session_id)
+        context = await self._load_report_context(session_id)
+        
+        # GPT로 OSD 기반 리스크 보고서 생성 (동기 스트리밍 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+        gpt_report = await asyncio.to_thread(
+            self.gpt_service.generate_risk_report,
+            context["business_name"],
+            context["business_description"],
+            context["investment_amount"],
+            context["methods"],
+            context["questions"],
+            answer_request.answers,
+            context["industry_category"]
+        )
+        
+        final_report = self._finalize_report(session_id, context, gpt_report)
+        await self._save_report(session_id, answer_request, final_report)
+        return final_report
+    
+    async def generate_final_report_stream(
+        self, 
+        answer_request: AnswerSubmissionRequest
+    ) -> AsyncIterator[Dict]:
+        """
+        5단계: 최종 리스크 보고서를 스트리밍으로 생성
+        
+        분석 기법 결과가 완성될 때마다 {"type": "method_result", "data": ...}를 내보내고,
+        마지막에 {"type": "final_report", "data": 최종 보고서}를 내보냄
+        (세션 오류는 스트리밍 시작 전에 ValueError로 발생)
+        """
+        session_id = answer_request.session_id
+        context = await self._load_report_context(session_id)
+        
+        async def events() -> AsyncIterator[Dict]:
+            stream = self.gpt_service.generate_risk_report_stream(
+                context["business_name"],
+                context["business_description"],
+                context["investment_amount"],
+                context["methods"],
+                context["questions"],
+                answer_request.answers,
+                context["industry_category"]
+            )
+            # 동기 스트림을 전용 스레드 하나에서 읽음 (취소되어도 close가 진행 중인 next 뒤에 실행됨)
+            loop = asyncio.get_running_loop()
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                while True:
+                    event = await loop.run_in_executor(executor, next, stream, None)
+                    if event is None:
+                        break
+                    if event["type"] == "method_result":
+                        yield event
+                    elif event["type"] == "report":
+                        final_report = self._finalize_report(session_id, context, event["data"])
+                        await self._save_report(session_id, answer_request, final_report)
+                        yield {"type": "final_report", "data": final_report.model_dump()}
+            finally:
+                executor.submit(stream.close)
+                executor.shutdown(wait=False)
+        
+        return events()
+    
+    async def _load_report_context(self, session_id: str) -> Dict:
+        """보고서 생성에 필요한 세션 정보 복원 (세션이 없으면 ValueError)"""
+        session = await self.session_store.get_session(session_id)
         if not session:
             raise ValueError("유효하지 않은 세션 ID입니다.")
-        
-        # 세션에서 정보 추출
-        business_name = session["business_name"]
-        business_description = session["business_description"]
-        investment_amount = session.get("investment_amount")
+        if not session.get("questions"):
+            raise ValueError("질문이 아직 생성되지 않았습니다. 먼저 질문을 생성해주세요.")
         
         # 업종 카테고리 추출
         categories_data = session.get("categories", [])
         industry_category = IndustryCategory(categories_data[0]["category_id"]) if categories_data else IndustryCategory.GENERAL_BUSINESS
         
         # 문자열을 객체로 복원
-        from .models import AnalysisMethod
-        methods = [AnalysisMethod(m) for m in session["methods"]]
-        questions = [Question(**q) for q in session["questions"]]
-        
-        # GPT로 OSD 기반 리스크 보고서 생성
-        gpt_report = self.gpt_service.generate_risk_report(
-            business_name,
-            business_description,
-            investment_amount,
-            methods,
-            questions,
-            answer_request.answers,
-            industry_category
-        )
+        return {
+            "business_name": session["business_name"],
+            "business_description": session["business_description"],
+            "investment_amount": session.get("investment_amount"),
+            "industry_category": industry_category,
+            "methods": [_METHOD_BY_VALUE[m] for m in session["methods"]],
+            "questions": _QUESTION_LIST.validate_python(session["questions"]),
+        }
+    
+    def _finalize_report(
+        self,
+        session_id: str,
+        context: Dict,
+        gpt_report: Dict
+    ) -> FinalRiskReport:
+        """GPT 보고서에 리스크 점수·현금 손실 분석을 더해 최종 보고서 생성"""
+        business_name = context["business_name"]
+        investment_amount = context["investment_amount"]
+        industry_category = context["industry_category"]
+        methods = context["methods"]
         
         # 1. 분석 기법별 OSD 리스크 구조화
         method_results = []
         all_osd_scores = []
         
         for result in gpt_report["method_results"]:
-            osd_risks = [OSDScore(**osd) for osd in result["osd_risks"]]
+            # Gemini 응답에서 파싱한 값이므로 항상 검증 (O/S/D 범위 등)
+            osd_risks = _OSD_LIST.validate_python(result["osd_risks"])
             all_osd_scores.extend(osd_risks)
             
             method_results.append(MethodAnalysisResult(
@@ -212,9 +528,10 @@ class RiskAnalysisService:
                 industry_category
             )
             
-            cash_loss_analysis = CashLossAnalysis(
+            cash_loss_analysis = _build_model(
+                CashLossAnalysis,
                 total_expected_loss=cost_analysis["total_expected_loss"],
-                cost_breakdown=CostBreakdown(**cost_analysis["cost_breakdown"]),
+                cost_breakdown=_build_model(CostBreakdown, **cost_analysis["cost_breakdown"]),
                 loss_by_risk=cost_analysis["loss_by_risk"],
                 probability_weighted_loss=cost_analysis["probability_weighted_loss"]
             )
@@ -222,13 +539,12 @@ class RiskAnalysisService:
             # 투자금액이 없는 경우 None으로 설정
             cash_loss_analysis = None
         
-        # 4. AI 조언 구조화
-        ai_recommendations = [
-            AIRecommendation(**rec) for rec in gpt_report["ai_recommendations"]
-        ]
+        # 4. AI 조언 구조화 (Gemini 응답에서 파싱한 값이므로 항상 검증)
+        ai_recommendations = _RECOMMENDATION_LIST.validate_python(gpt_report["ai_recommendations"])
         
         # 최종 보고서 생성
-        final_report = FinalRiskReport(
+        final_report = _build_model(
+            FinalRiskReport,
             session_id=session_id,
             business_name=business_name,
             overall_risk_score=overall_risk_score,
@@ -242,11 +558,17 @@ class RiskAnalysisService:
             analysis_methods_used=[m.value for m in methods]
         )
         
-        # 세션 업데이트 (답변 저장)
-        self.session_store.update_session(session_id, {
-            "answers": [a.dict() for a in answer_request.answers],
+        return final_report
+    
+    async def _save_report(
+        self,
+        session_id: str,
+        answer_request: AnswerSubmissionRequest,
+        final_report: FinalRiskReport
+    ):
+        """세션 업데이트 (답변 저장, 보고서는 거의 다시 읽지 않으므로 JSON 문자열로 보관)"""
+        await self.session_store.update_session(session_id, {
+            "answers": _ANSWER_LIST.dump_python(answer_request.answers, mode="json"),
             "stage": "report_generated",
-            "final_report": final_report.dict()
+            "final_report_json": final_report.model_dump_json()
         })
-        
-        return final_report
@@ -0,0 +1,4 @@
+import os
+
+# app.config가 설정을 읽기 전에 테스트용 API 키 지정
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
@@ -0,0 +1,37 @@
+"""업종 분류기 테스트 (일괄 분류 = 단건 분류)"""
+from app.classifier import classify_business, classify_business_batch
+
+
+DESCRIPTIONS = [
+    "강남역 근처에서 스페셜티 커피를 판매하는 카페 창업",
+    "중소기업 대상 SaaS 회계 플랫폼 개발",
+    "온라인 쇼핑몰에서 수제 액세서리 판매",
+    "세탁소 운영",
+    "",
+    "아무 관련 없는 문장입니다",
+    "카페와 베이커리를 겸한 매장, 온라인 배달 앱 입점",
+]
+
+
+def _as_dicts(categories):
+    return [category.model_dump() for category in categories]
+
+
+def test_batch_matches_single_classification():
+    batch = classify_business_batch(DESCRIPTIONS)
+    
+    assert len(batch) == len(DESCRIPTIONS)
+    for description, categories in zip(DESCRIPTIONS, batch):
+        assert _as_dicts(categories) == _as_dicts(classify_business(description))
+
+
+def test_batch_does_not_match_across_descriptions():
+    # 앞 설명의 끝과 뒤 설명의 시작이 이어져 키워드가 되면 안 됨
+    batch = classify_business_batch(["카", "페"])
+    
+    assert _as_dicts(batch[0]) == _as_dicts(classify_business("카"))
+    assert _as_dicts(batch[1]) == _as_dicts(classify_business("페"))
+
+
+def test_empty_batch():
+    assert classify_business_batch([]) == []
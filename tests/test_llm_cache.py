@@ -0,0 +1,69 @@
+"""LLMCache 테스트 (LRU 제거, TTL 만료, 통계)"""
+from app import llm_cache
+from app.llm_cache import LLMCache
+
+
+class FakeClock:
+    """time.monotonic 대체용 수동 시계"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_is_deterministic():
+    key = LLMCache.cache_key("model", "입력", {"b": 1, "a": 2})
+    
+    assert key == LLMCache.cache_key("model", "입력", {"a": 2, "b": 1})
+    assert key != LLMCache.cache_key("other-model", "입력", {"a": 2, "b": 1})
+    assert key != LLMCache.cache_key("model", "다른 입력", {"a": 2, "b": 1})
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = LLMCache(max_entries=2, ttl_seconds=0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    # a를 조회하면 b가 가장 오래 사용되지 않은 항목이 됨
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_expiry(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "monotonic", clock)
+    cache = LLMCache(max_entries=10, ttl_seconds=60)
+    cache.set("a", 1)
+    
+    clock.now += 59
+    assert cache.get("a") == 1
+    
+    clock.now += 2
+    assert cache.get("a") is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_zero_ttl_never_expires(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "monotonic", clock)
+    cache = LLMCache(max_entries=10, ttl_seconds=0)
+    cache.set("a", 1)
+    
+    clock.now += 10 ** 9
+    assert cache.get("a") == 1
+
+
+def test_stats_count_hits_and_misses():
+    cache = LLMCache(max_entries=10, ttl_seconds=0)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+    
+    assert cache.get_stats() == {"hits": 2, "misses": 1, "size": 1}
@@ -0,0 +1,91 @@
+"""인메모리 SessionStore 테스트 (유효 시간, 최대 세션 수, 제거 알림)"""
+import asyncio
+
+from app import service
+from app.service import SessionStore
+
+
+class FakeClock:
+    """time.monotonic 대체용 수동 시계"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def _patch_clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(service.time, "monotonic", clock)
+    return clock
+
+
+def test_session_expires_after_ttl(monkeypatch):
+    clock = _patch_clock(monkeypatch)
+    store = SessionStore(max_sessions=10, ttl_seconds=60)
+    removed = []
+    store.add_removal_listener(removed.append)
+    
+    async def scenario():
+        session_id = await store.create_session({"business_description": "카페"})
+        clock.now += 59
+        assert (await store.get_session(session_id))["business_description"] == "카페"
+        
+        clock.now += 2
+        assert await store.get_session(session_id) is None
+        return session_id
+    
+    session_id = asyncio.run(scenario())
+    assert removed == [session_id]
+    assert store.session_count() == 0
+
+
+def test_update_refreshes_ttl(monkeypatch):
+    clock = _patch_clock(monkeypatch)
+    store = SessionStore(max_sessions=10, ttl_seconds=60)
+    
+    async def scenario():
+        session_id = await store.create_session({})
+        clock.now += 50
+        await store.update_session(session_id, {"questions": []})
+        clock.now += 50
+        return await store.get_session(session_id)
+    
+    session = asyncio.run(scenario())
+    assert session is not None
+    assert session["questions"] == []
+
+
+def test_lru_eviction_notifies_listener():
+    store = SessionStore(max_sessions=2, ttl_seconds=60)
+    removed = []
+    store.add_removal_listener(removed.append)
+    
+    async def scenario():
+        first = await store.create_session({})
+        second = await store.create_session({})
+        
+        # first를 조회하면 second가 가장 오래 사용되지 않은 세션이 됨
+        await store.get_session(first)
+        third = await store.create_session({})
+        return first, second, third
+    
+    first, second, third = asyncio.run(scenario())
+    assert removed == [second]
+    assert set(store.sessions) == {first, third}
+
+
+def test_delete_notifies_listener():
+    store = SessionStore(max_sessions=10, ttl_seconds=60)
+    removed = []
+    store.add_removal_listener(removed.append)
+    
+    async def scenario():
+        session_id = await store.create_session({})
+        await store.delete_session(session_id)
+        return session_id, await store.get_session(session_id)
+    
+    session_id, session = asyncio.run(scenario())
+    assert session is None
+    assert removed == [session_id]
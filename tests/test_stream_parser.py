@@ -0,0 +1,65 @@
+"""보고서 스트리밍 파서(_OSDStreamParser) 테스트"""
+import pytest
+
+from app.gpt_service import _OSDStreamParser
+from app.models import AnalysisMethod
+
+
+REPORT_TEXT = """## 1. 각 분석 기법별 OSD 리스크 분석
+
+**기법: Lean Canvas**
+- 리스크1: 초기 사용자 확보 실패 | O=7 | S=8 | D=5 | Score=280
+- 리스크2: [수익 모델 불명확] | O=6 | S=9 | D=12 | Score=540
+주요발견: 고객 문제 검증이 부족합니다
+
+**기법: SWOT 분석**
+리스크1: 경쟁 심화 | O=8 | S=6 | D=4 | Score=192
+인사이트: 차별화 필요
+
+## 2. AI 조언
+조언1: 시장 검증 | 우선순위: 높음 | 인터뷰 20건 수행 | PMF 확인 | 난이도: 쉬움
+조언2: [재무] | [중간] | [런웨이 관리] | [자금 리스크 감소] | [보통]
+조언3: 깨진 형식
+
+### 경영진 요약
+첫 문단입니다.
+
+둘째 문단입니다."""
+
+
+def _parse(chunk_size: int):
+    parser = _OSDStreamParser([AnalysisMethod.LEAN_CANVAS, AnalysisMethod.SWOT])
+    events = []
+    for start in range(0, len(REPORT_TEXT), chunk_size):
+        events += parser.feed(REPORT_TEXT[start:start + chunk_size])
+    events += parser.close()
+    return parser, events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 50, len(REPORT_TEXT)])
+def test_method_events_are_independent_of_chunking(chunk_size):
+    _, events = _parse(chunk_size)
+    
+    assert [event["method"] for event in events] == [
+        AnalysisMethod.LEAN_CANVAS,
+        AnalysisMethod.SWOT
+    ]
+    lean_risks = events[0]["osd_risks"]
+    assert len(lean_risks) == 2
+    assert lean_risks[0]["risk_score"] == 280
+    # 괄호는 제거하고 범위를 벗어난 점수는 1~10으로 보정
+    assert lean_risks[1]["description"] == "수익 모델 불명확"
+    assert lean_risks[1]["detection"] == 10
+    assert lean_risks[1]["risk_score"] == 540
+    assert len(events[1]["osd_risks"]) == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 50, len(REPORT_TEXT)])
+def test_recommendations_and_summary(chunk_size):
+    parser, _ = _parse(chunk_size)
+    
+    # 형식이 깨진 조언은 건너뜀
+    assert len(parser.recommendations) == 2
+    assert parser.recommendations[0]["priority"] == "높음"
+    assert parser.recommendations[1]["implementation_difficulty"] == "보통"
+    assert "\n".join(parser.summary_lines).strip() == "첫 문단입니다.\n\n둘째 문단입니다."
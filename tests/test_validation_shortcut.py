@@ -0,0 +1,51 @@
+"""입력 검증 로컬 통과(_get_local_validation) 테스트"""
+import pytest
+
+from app import gpt_service
+from app.gpt_service import GPTService
+from app.llm_cache import LLMCache
+
+
+@pytest.fixture
+def gpt():
+    return GPTService(api_key="test-key")
+
+
+def _local_validation(gpt: GPTService, description: str):
+    return gpt._get_local_validation(description, LLMCache.cache_key("test", description))
+
+
+def test_clear_industry_description_passes(gpt):
+    result = _local_validation(gpt, "강남역 근처 스페셜티 커피 카페 창업, 디저트와 원두 판매")
+    
+    assert result is not None
+    assert result["is_valid"] is True
+
+
+def test_long_description_with_business_keywords_passes(gpt):
+    description = "지역 소상공인 고객을 위한 예약 관리 서비스를 만들어 월 구독으로 수익을 내려고 합니다"
+    result = _local_validation(gpt, description)
+    
+    assert result is not None
+    assert result["is_valid"] is True
+
+
+@pytest.mark.parametrize("description", ["치킨집", "세탁소 운영", "떡볶이 푸드트럭", "안녕하세요"])
+def test_short_or_ambiguous_input_goes_to_api(gpt, description):
+    # 짧거나 애매한 입력은 로컬에서 거절하지 않고 API 검증으로 넘김
+    assert _local_validation(gpt, description) is None
+
+
+def test_shortcut_disabled(gpt, monkeypatch):
+    monkeypatch.setattr(gpt_service.settings, "validation_local_shortcut", False)
+    
+    assert _local_validation(gpt, "강남역 근처 스페셜티 커피 카페 창업, 디저트와 원두 판매") is None
+
+
+def test_cached_result_is_reused(gpt):
+    description = "안녕하세요"
+    cache_key = LLMCache.cache_key("test", description)
+    cached = {"is_valid": False, "message": "비즈니스 관련 입력이 아닙니다.", "suggestion": ""}
+    gpt._validation_cache.set(cache_key, cached)
+    
+    assert gpt._get_local_validation(description, cache_key) == cached